@@ -0,0 +1,27 @@
+"""Add functional index on lower(quizzes.title)
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "002"
+down_revision: Union[str, None] = "001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Supports case-insensitive title lookups from the AI chat tools
+    op.create_index("ix_quizzes_title_lower", "quizzes", [sa.text("lower(title)")])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_quizzes_title_lower", table_name="quizzes")
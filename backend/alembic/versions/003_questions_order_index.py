@@ -0,0 +1,29 @@
+"""Add composite index on questions (quiz_id, order_index)
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "003"
+down_revision: Union[str, None] = "002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Quiz.questions is loaded ordered by order_index; lets the index return
+    # rows pre-sorted per quiz
+    op.create_index(
+        "ix_questions_quiz_id_order", "questions", ["quiz_id", "order_index"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_questions_quiz_id_order", table_name="questions")
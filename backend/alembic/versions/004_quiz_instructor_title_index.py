@@ -0,0 +1,39 @@
+"""Add covering index on quizzes (instructor_id, lower(title))
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "004"
+down_revision: Union[str, None] = "003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # AI chat tools look quizzes up by title within one instructor; the
+    # included columns let that lookup run as an index-only scan
+    op.execute(
+        "CREATE INDEX ix_quizzes_instructor_title "
+        "ON quizzes (instructor_id, lower(title)) "
+        "INCLUDE (id, title, topic, is_published, created_at)"
+    )
+    # Leading instructor_id column makes the single-column index redundant
+    op.drop_index("ix_quizzes_instructor_id", table_name="quizzes")
+    # Title lookups are always scoped to an instructor, so this index now
+    # serves them and the lower(title) index from 002 is pure write overhead
+    op.drop_index("ix_quizzes_title_lower", table_name="quizzes")
+
+
+def downgrade() -> None:
+    op.create_index("ix_quizzes_title_lower", "quizzes", [sa.text("lower(title)")])
+    op.create_index("ix_quizzes_instructor_id", "quizzes", ["instructor_id"])
+    op.drop_index("ix_quizzes_instructor_title", table_name="quizzes")
@@ -0,0 +1,50 @@
+"""Add composite indexes for quiz, attempt, answer and tag lookups
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "005"
+down_revision: Union[str, None] = "004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Instructor quiz listings are ordered by newest first
+    op.create_index(
+        "ix_quizzes_instructor_created", "quizzes", ["instructor_id", "created_at"]
+    )
+    # Tag filters probe quiz_tags by tag; the primary key leads with quiz_id
+    op.create_index("ix_quiz_tags_tag", "quiz_tags", ["tag"])
+    # Attempt answers are loaded per attempt and had no index on attempt_id
+    op.create_index("ix_attempt_answers_attempt_id", "attempt_answers", ["attempt_id"])
+
+    # Analytics and resume lookups filter attempts by quiz and status; a user's
+    # attempt history is ordered by start time. Both replace single-column
+    # indexes on their leading column.
+    op.create_index(
+        "ix_quiz_attempts_quiz_status", "quiz_attempts", ["quiz_id", "status"]
+    )
+    op.drop_index("ix_quiz_attempts_quiz_id", table_name="quiz_attempts")
+    op.create_index(
+        "ix_quiz_attempts_user_started", "quiz_attempts", ["user_id", "started_at"]
+    )
+    op.drop_index("ix_quiz_attempts_user_id", table_name="quiz_attempts")
+
+
+def downgrade() -> None:
+    op.create_index("ix_quiz_attempts_user_id", "quiz_attempts", ["user_id"])
+    op.drop_index("ix_quiz_attempts_user_started", table_name="quiz_attempts")
+    op.create_index("ix_quiz_attempts_quiz_id", "quiz_attempts", ["quiz_id"])
+    op.drop_index("ix_quiz_attempts_quiz_status", table_name="quiz_attempts")
+    op.drop_index("ix_attempt_answers_attempt_id", table_name="attempt_answers")
+    op.drop_index("ix_quiz_tags_tag", table_name="quiz_tags")
+    op.drop_index("ix_quizzes_instructor_created", table_name="quizzes")
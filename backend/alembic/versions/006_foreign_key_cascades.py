@@ -0,0 +1,61 @@
+"""Cascade deletes through foreign keys in the database
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "006"
+down_revision: Union[str, None] = "005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column, referenced table) for every foreign key that cascades.
+# attempt_answers.question_id is left as NO ACTION: replacing a quiz's
+# questions must not silently delete students' graded answers. Deleting a whole
+# quiz still works, as its attempts (and their answers) cascade in the same
+# statement.
+FOREIGN_KEYS = [
+    ("quizzes", "instructor_id", "users"),
+    ("quiz_tags", "quiz_id", "quizzes"),
+    ("questions", "quiz_id", "quizzes"),
+    ("quiz_attempts", "quiz_id", "quizzes"),
+    ("quiz_attempts", "user_id", "users"),
+    ("attempt_answers", "attempt_id", "quiz_attempts"),
+    ("refresh_tokens", "user_id", "users"),
+]
+
+
+def _foreign_key_name(table: str, column: str) -> str:
+    """Look up the name of the single-column foreign key on table.column."""
+    inspector = sa.inspect(op.get_bind())
+    for foreign_key in inspector.get_foreign_keys(table):
+        if foreign_key["constrained_columns"] == [column]:
+            return foreign_key["name"]
+    raise RuntimeError(f"No foreign key found on {table}.{column}")
+
+
+def _recreate_foreign_keys(ondelete: Union[str, None]) -> None:
+    for table, column, referent in FOREIGN_KEYS:
+        name = _foreign_key_name(table, column)
+        op.drop_constraint(name, table, type_="foreignkey")
+        op.create_foreign_key(
+            name, table, referent, [column], ["id"], ondelete=ondelete
+        )
+
+
+def upgrade() -> None:
+    # Deleting a user or quiz becomes one statement; children are removed by
+    # PostgreSQL instead of being loaded and deleted one by one by the ORM
+    _recreate_foreign_keys("CASCADE")
+
+
+def downgrade() -> None:
+    _recreate_foreign_keys(None)
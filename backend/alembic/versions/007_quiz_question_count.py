@@ -0,0 +1,35 @@
+"""Add denormalized question_count to quizzes
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "007"
+down_revision: Union[str, None] = "006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Quiz list pages report question totals from this column instead of
+    # loading every question; existing quizzes are backfilled from questions
+    op.add_column(
+        "quizzes",
+        sa.Column("question_count", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.execute(
+        "UPDATE quizzes SET question_count = "
+        "(SELECT COUNT(*) FROM questions WHERE questions.quiz_id = quizzes.id)"
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("quizzes", "question_count")
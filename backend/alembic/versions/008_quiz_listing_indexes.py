@@ -0,0 +1,62 @@
+"""Add quiz listing indexes, trigram search indexes and attempt_count
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "008"
+down_revision: Union[str, None] = "007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Columns matched by the quiz search box with ILIKE '%term%'
+SEARCH_COLUMNS = ("title", "description", "topic")
+
+
+def upgrade() -> None:
+    # "Popular" listings order by this counter instead of joining a per-quiz
+    # COUNT over quiz_attempts; existing quizzes are backfilled
+    op.add_column(
+        "quizzes",
+        sa.Column("attempt_count", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.execute(
+        "UPDATE quizzes SET attempt_count = "
+        "(SELECT COUNT(*) FROM quiz_attempts WHERE quiz_attempts.quiz_id = quizzes.id)"
+    )
+
+    # Published listings: newest first (with the id tiebreak used by keyset
+    # cursors) and most attempted first
+    op.create_index(
+        "ix_quizzes_published_created",
+        "quizzes",
+        ["is_published", "created_at", "id"],
+    )
+    op.create_index(
+        "ix_quizzes_published_attempts", "quizzes", ["is_published", "attempt_count"]
+    )
+
+    # Leading-wildcard ILIKE cannot use a B-tree; trigram GIN indexes serve it
+    # per column and the planner ORs them with a bitmap scan
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for column in SEARCH_COLUMNS:
+        op.execute(
+            f"CREATE INDEX ix_quizzes_{column}_trgm "
+            f"ON quizzes USING gin ({column} gin_trgm_ops)"
+        )
+
+
+def downgrade() -> None:
+    for column in SEARCH_COLUMNS:
+        op.drop_index(f"ix_quizzes_{column}_trgm", table_name="quizzes")
+    op.drop_index("ix_quizzes_published_attempts", table_name="quizzes")
+    op.drop_index("ix_quizzes_published_created", table_name="quizzes")
+    op.drop_column("quizzes", "attempt_count")
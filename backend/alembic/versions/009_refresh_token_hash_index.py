@@ -0,0 +1,33 @@
+"""Use a hash index for refresh token lookups
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "009"
+down_revision: Union[str, None] = "008"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Token lookups are equality-only, so a hash index is sufficient
+    op.drop_index("ix_refresh_tokens_token_hash", table_name="refresh_tokens")
+    op.create_index(
+        "ix_refresh_tokens_token_hash",
+        "refresh_tokens",
+        ["token_hash"],
+        postgresql_using="hash",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_refresh_tokens_token_hash", table_name="refresh_tokens")
+    op.create_index("ix_refresh_tokens_token_hash", "refresh_tokens", ["token_hash"])
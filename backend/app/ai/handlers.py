@@ -1,17 +1,133 @@
 """Tool execution handlers for AI chatbot."""
 
-import json
-from typing import Any, Dict, List
+import asyncio
+import logging
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
 
+import orjson
 from openai import AsyncOpenAI
 
-from app.models.quiz import AnswerOption
+from app.models.quiz import AnswerOption, Quiz
 from app.schemas.quiz import QuestionCreate, QuizCreate, QuizUpdate
 from app.services.analytics_service import AnalyticsService
 from app.services.quiz_service import QuizService
 from app.services.wikipedia_service import WikipediaService
 
+logger = logging.getLogger(__name__)
+
+# Upper bound on waiting for Wikipedia context before generating without it
+WIKIPEDIA_TIMEOUT_SECONDS = 3.0
+
+# Questions are over-generated per topic and the surplus kept for a few minutes,
+# so follow-ups like "add 3 more about X" are served without another LLM call.
+# The pool is per instructor: surplus questions are never handed to another
+# instructor's quiz.
+QUESTION_POOL_SIZE = 10
+QUESTION_POOL_TTL_SECONDS = 300.0
+
+# (instructor id, normalized topic) -> (expires_at, unused generated questions)
+_question_pool: Dict[Tuple[UUID, str], Tuple[float, List[Dict[str, Any]]]] = {}
+
+GENERATOR_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "You are an educational quiz generator. Always respond with valid JSON.",
+}
+
+# Static pieces of the question generation prompt, joined per request
+_PROMPT_HEAD = "Generate exactly "
+_PROMPT_TOPIC = ' multiple-choice questions about "'
+_PROMPT_CONTEXT = "\n\nReference content from Wikipedia:\n"
+_PROMPT_TAIL = """
+
+For each question, provide:
+1. The question text
+2. Four options (A, B, C, D)
+3. The correct answer (A, B, C, or D)
+4. An explanation of why the correct answer is right
+
+Return as JSON array:
+[{"question_text": "...", "option_a": "...", "option_b": "...", "option_c": "...", "option_d": "...", "correct_answer": "A", "explanation": "..."}]
+
+Make questions educational, accurate, and appropriate for a general audience."""
+
+# Leaderboard entries included in analytics tool results
+TOP_STUDENTS_LIMIT = 5
+
+# Letter -> AnswerOption lookup, avoids EnumMeta.__call__ per generated question
+_ANSWER_MAP = {option.value: option for option in AnswerOption}
+
+# Fixed English month names; strftime("%B") is locale-dependent and slower
+_MONTHS = (
+    "January",
+    "February",
+    "March",
+    "April",
+    "May",
+    "June",
+    "July",
+    "August",
+    "September",
+    "October",
+    "November",
+    "December",
+)
+
+
+def _fmt_date(dt: datetime) -> str:
+    """Format a date like "March 05, 2024" (same output as "%B %d, %Y")."""
+    return f"{_MONTHS[dt.month - 1]} {dt.day:02d}, {dt.year}"
+
+
+def _answer_option(letter: str) -> AnswerOption:
+    """Map a generated answer letter to AnswerOption (ValueError if invalid)."""
+    option = _ANSWER_MAP.get(letter)
+    if option is None:
+        raise ValueError(f"{letter!r} is not a valid AnswerOption")
+    return option
+
+
+def _truncate50(text: str) -> str:
+    """Shorten text to a 50-character preview, only adding "..." when cut."""
+    return text[:50] + "..." if len(text) > 50 else text
+
+
+def _take_pooled_questions(
+    pool_key: Tuple[UUID, str], num_questions: int
+) -> Optional[List[Dict[str, Any]]]:
+    """Pop num_questions unused questions for a topic, or None if not enough."""
+    entry = _question_pool.get(pool_key)
+    if entry is None:
+        return None
+
+    expires_at, questions = entry
+    if time.monotonic() >= expires_at:
+        del _question_pool[pool_key]
+        return None
+    if len(questions) < num_questions:
+        return None
+
+    taken, remaining = questions[:num_questions], questions[num_questions:]
+    if remaining:
+        _question_pool[pool_key] = (expires_at, remaining)
+    else:
+        del _question_pool[pool_key]
+    return taken
+
+
+def _store_pooled_questions(
+    pool_key: Tuple[UUID, str], questions: List[Dict[str, Any]]
+) -> None:
+    """Keep surplus generated questions for a topic until the pool TTL expires."""
+    now = time.monotonic()
+    expired = [k for k, (expires_at, _) in _question_pool.items() if expires_at <= now]
+    for key in expired:
+        del _question_pool[key]
+    if questions:
+        _question_pool[pool_key] = (now + QUESTION_POOL_TTL_SECONDS, questions)
+
 
 class ToolHandler:
     """Handles execution of AI chatbot tools."""
@@ -30,11 +146,8 @@ class ToolHandler:
         self.client = openai_client
         self.instructor_id = instructor_id
 
-    async def execute(
-        self, tool_name: str, arguments: Dict[str, Any]
-    ) -> Dict[str, Any]:
-        """Execute a tool by name and return the result."""
-        handlers = {
+        # Bound handlers are created once per ToolHandler, not on every call
+        self._handlers = {
             "generate_quiz": self._handle_generate_quiz,
             "edit_quiz": self._handle_edit_quiz,
             "delete_quiz": self._handle_delete_quiz,
@@ -43,48 +156,137 @@ class ToolHandler:
             "get_quiz_analytics": self._handle_get_quiz_analytics,
             "edit_question": self._handle_edit_question,
             "add_questions": self._handle_add_questions,
+            "add_questions_bulk": self._handle_add_questions_bulk,
         }
 
-        handler = handlers.get(tool_name)
-        if not handler:
+    async def execute(
+        self, tool_name: str, arguments: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Execute a tool by name and return the result."""
+        handler = self._handlers.get(tool_name)
+        if handler is None:
             return {"error": f"Unknown tool: {tool_name}"}
 
         return await handler(arguments)
 
-    async def _find_quiz_by_title(self, title: str):
-        """Find a quiz by title (case-insensitive, partial match)."""
-        result = await self.quiz_service.list_quizzes(instructor_id=self.instructor_id)
-
-        # Exact match first
-        for quiz in result.quizzes:
-            if quiz.title.lower() == title.lower():
-                return await self.quiz_service.get_quiz_by_id(quiz.id)
-
-        # Partial match
-        title_lower = title.lower()
-        for quiz in result.quizzes:
-            if title_lower in quiz.title.lower() or quiz.title.lower() in title_lower:
-                return await self.quiz_service.get_quiz_by_id(quiz.id)
-
-        return None
+    async def execute_many(
+        self, calls: List[Tuple[str, Dict[str, Any]]]
+    ) -> List[Dict[str, Any]]:
+        """Execute one assistant turn's tool calls, returning results in order.
+
+        Handlers run one after another because every service shares one
+        AsyncSession. Question generation for generate_quiz calls only talks to
+        Wikipedia and OpenAI, so it is started for all of them up front and
+        those network waits overlap.
+        """
+        generation = {
+            idx: asyncio.create_task(
+                self._generate_questions(args["topic"], args.get("num_questions", 5))
+            )
+            for idx, (tool_name, args) in enumerate(calls)
+            if tool_name == "generate_quiz" and "topic" in args
+        }
 
-    async def _get_available_quiz_titles(self) -> List[str]:
-        """Get list of available quiz titles for error messages."""
-        result = await self.quiz_service.list_quizzes(instructor_id=self.instructor_id)
-        return [q.title for q in result.quizzes]
+        results = []
+        try:
+            for idx, (tool_name, args) in enumerate(calls):
+                if idx in generation:
+                    result = await self._handle_generate_quiz(args, generation[idx])
+                else:
+                    result = await self.execute(tool_name, args)
+                results.append(result)
+        finally:
+            # A failed handler leaves later generations unused; don't leak them
+            for task in generation.values():
+                if not task.done():
+                    task.cancel()
+                elif not task.cancelled():
+                    task.exception()
+        return results
 
     async def _generate_questions(
         self, topic: str, num_questions: int = 5
     ) -> List[Dict[str, Any]]:
-        """Generate quiz questions using GPT-4o with Wikipedia context."""
-        wiki_content = await self.wikipedia.search_and_extract(topic)
-        context = (
-            f"\n\nReference content from Wikipedia:\n{wiki_content}"
-            if wiki_content
-            else ""
+        """Generate quiz questions using GPT-4o with Wikipedia context.
+
+        Served from the instructor's per-topic question pool when it holds
+        enough unused questions; otherwise generates a full pool batch and
+        keeps the surplus.
+        """
+        pool_key = (self.instructor_id, topic.strip().lower())
+        pooled = _take_pooled_questions(pool_key, num_questions)
+        if pooled is not None:
+            return pooled
+
+        wiki_content = await self._fetch_wiki_context(topic, 8000)
+
+        prompt = "".join(
+            [
+                _PROMPT_HEAD,
+                str(max(num_questions, QUESTION_POOL_SIZE)),
+                _PROMPT_TOPIC,
+                topic,
+                '".',
+                _PROMPT_CONTEXT if wiki_content else "",
+                wiki_content,
+                _PROMPT_TAIL,
+            ]
         )
 
-        prompt = f"""Generate exactly {num_questions} multiple-choice questions about "{topic}".{context}
+        response = await self.client.chat.completions.create(
+            model="gpt-4o",
+            messages=[GENERATOR_SYSTEM_MESSAGE, {"role": "user", "content": prompt}],
+            response_format={"type": "json_object"},
+        )
+
+        content = response.choices[0].message.content
+        if not content:
+            raise ValueError("OpenAI returned empty response")
+
+        data = orjson.loads(content)
+        questions = data if isinstance(data, list) else data.get("questions", [])
+        _store_pooled_questions(pool_key, questions[num_questions:])
+        return questions[:num_questions]
+
+    async def _fetch_wiki_context(self, topic: str, max_chars: int) -> str:
+        """Fetch Wikipedia reference text for a topic, or "" if slow/unavailable."""
+        try:
+            content = await asyncio.wait_for(
+                self.wikipedia.search_and_extract(topic, max_chars=max_chars),
+                timeout=WIKIPEDIA_TIMEOUT_SECONDS,
+            )
+        except asyncio.TimeoutError:
+            logger.warning(f"Wikipedia lookup timed out for: {topic}")
+            return ""
+        return content or ""
+
+    async def _generate_question_sets(
+        self, targets: List[Tuple[str, int]]
+    ) -> List[List[Dict[str, Any]]]:
+        """Generate several question sets with a single GPT-4o call.
+
+        targets is a list of (topic, num_questions); the result holds each
+        target's generated questions at the same position. Sets are keyed
+        "q0", "q1", ... in the prompt so repeated topics or quizzes stay apart.
+        """
+        topics = list(dict.fromkeys(topic for topic, _ in targets))
+        # Split the usual Wikipedia budget across topics to keep the prompt bounded
+        max_chars = max(8000 // len(topics), 1000)
+        contexts = await asyncio.gather(
+            *(self._fetch_wiki_context(topic, max_chars) for topic in topics)
+        )
+
+        request_lines = "\n".join(
+            f'- "q{idx}": exactly {num} multiple-choice questions about "{topic}"'
+            for idx, (topic, num) in enumerate(targets)
+        )
+        reference = "".join(
+            f"\n\nReference content from Wikipedia on {topic}:\n{context}"
+            for topic, context in zip(topics, contexts)
+            if context
+        )
+        prompt = f"""Generate the following question sets:
+{request_lines}{reference}
 
 For each question, provide:
 1. The question text
@@ -92,20 +294,14 @@ For each question, provide:
 3. The correct answer (A, B, C, or D)
 4. An explanation of why the correct answer is right
 
-Return as JSON array:
-[{{"question_text": "...", "option_a": "...", "option_b": "...", "option_c": "...", "option_d": "...", "correct_answer": "A", "explanation": "..."}}]
+Return as a JSON object keyed by question set id:
+{{"q0": [{{"question_text": "...", "option_a": "...", "option_b": "...", "option_c": "...", "option_d": "...", "correct_answer": "A", "explanation": "..."}}]}}
 
 Make questions educational, accurate, and appropriate for a general audience."""
 
         response = await self.client.chat.completions.create(
             model="gpt-4o",
-            messages=[
-                {
-                    "role": "system",
-                    "content": "You are an educational quiz generator. Always respond with valid JSON.",
-                },
-                {"role": "user", "content": prompt},
-            ],
+            messages=[GENERATOR_SYSTEM_MESSAGE, {"role": "user", "content": prompt}],
             response_format={"type": "json_object"},
         )
 
@@ -113,18 +309,33 @@ Make questions educational, accurate, and appropriate for a general audience."""
         if not content:
             raise ValueError("OpenAI returned empty response")
 
-        data = json.loads(content)
-        questions = data if isinstance(data, list) else data.get("questions", [])
-        return questions[:num_questions]
+        data = orjson.loads(content)
+        if not isinstance(data, dict):
+            raise ValueError("OpenAI returned an unexpected question set format")
+
+        question_sets = []
+        for idx, (_, num) in enumerate(targets):
+            questions = data.get(f"q{idx}")
+            if not isinstance(questions, list):
+                questions = []
+            question_sets.append(questions[:num])
+        return question_sets
 
-    async def _handle_generate_quiz(self, args: Dict[str, Any]) -> Dict[str, Any]:
-        """Generate a new quiz."""
+    async def _handle_generate_quiz(
+        self,
+        args: Dict[str, Any],
+        questions_task: Optional[asyncio.Task] = None,
+    ) -> Dict[str, Any]:
+        """Generate a new quiz, optionally from already-started generation."""
         topic = args["topic"]
         title = args.get("title", f"Quiz: {topic}")
         tags = args.get("tags", [])
         num_questions = args.get("num_questions", 5)
 
-        questions_data = await self._generate_questions(topic, num_questions)
+        if questions_task is not None:
+            questions_data = await questions_task
+        else:
+            questions_data = await self._generate_questions(topic, num_questions)
 
         questions = [
             QuestionCreate(
@@ -133,7 +344,7 @@ Make questions educational, accurate, and appropriate for a general audience."""
                 option_b=q["option_b"],
                 option_c=q["option_c"],
                 option_d=q["option_d"],
-                correct_answer=AnswerOption(q["correct_answer"]),
+                correct_answer=_answer_option(q["correct_answer"]),
                 explanation=q.get("explanation"),
             )
             for q in questions_data
@@ -160,13 +371,15 @@ Make questions educational, accurate, and appropriate for a general audience."""
 
     async def _handle_edit_quiz(self, args: Dict[str, Any]) -> Dict[str, Any]:
         """Edit quiz properties."""
-        quiz = await self._find_quiz_by_title(args["quiz_title"])
+        quiz, titles = await self.quiz_service.find_with_titles(
+            self.instructor_id, args["quiz_title"]
+        )
 
         if not quiz:
             return {
                 "success": False,
                 "message": f"Could not find quiz '{args['quiz_title']}'",
-                "available_quizzes": await self._get_available_quiz_titles(),
+                "available_quizzes": titles,
             }
 
         updated = await self.quiz_service.update_quiz(
@@ -186,13 +399,15 @@ Make questions educational, accurate, and appropriate for a general audience."""
 
     async def _handle_delete_quiz(self, args: Dict[str, Any]) -> Dict[str, Any]:
         """Delete a quiz."""
-        quiz = await self._find_quiz_by_title(args["quiz_title"])
+        quiz, titles = await self.quiz_service.find_with_titles(
+            self.instructor_id, args["quiz_title"]
+        )
 
         if not quiz:
             return {
                 "success": False,
                 "message": f"Could not find quiz '{args['quiz_title']}'",
-                "available_quizzes": await self._get_available_quiz_titles(),
+                "available_quizzes": titles,
             }
 
         title = quiz.title
@@ -224,7 +439,7 @@ Make questions educational, accurate, and appropriate for a general audience."""
                     "topic": q.topic,
                     "tags": q.tags,
                     "question_count": q.question_count,
-                    "created": q.created_at.strftime("%B %d, %Y"),
+                    "created": _fmt_date(q.created_at),
                 }
                 for q in result.quizzes
             ],
@@ -233,17 +448,17 @@ Make questions educational, accurate, and appropriate for a general audience."""
 
     async def _handle_get_quiz_details(self, args: Dict[str, Any]) -> Dict[str, Any]:
         """Get quiz details."""
-        quiz = await self._find_quiz_by_title(args["quiz_title"])
+        quiz, titles = await self.quiz_service.find_with_titles(
+            self.instructor_id, args["quiz_title"]
+        )
 
         if not quiz:
             return {
                 "success": False,
                 "message": f"Could not find quiz '{args['quiz_title']}'",
-                "available_quizzes": await self._get_available_quiz_titles(),
+                "available_quizzes": titles,
             }
 
-        sorted_questions = sorted(quiz.questions, key=lambda x: x.order_index)
-
         return {
             "title": quiz.title,
             "description": quiz.description,
@@ -262,23 +477,27 @@ Make questions educational, accurate, and appropriate for a general audience."""
                     },
                     "correct_answer": q.correct_answer.value,
                 }
-                for idx, q in enumerate(sorted_questions)
+                for idx, q in enumerate(quiz.questions)
             ],
-            "created_at": quiz.created_at.strftime("%B %d, %Y"),
+            "created_at": _fmt_date(quiz.created_at),
         }
 
     async def _handle_get_quiz_analytics(self, args: Dict[str, Any]) -> Dict[str, Any]:
         """Get quiz analytics."""
-        quiz = await self._find_quiz_by_title(args["quiz_title"])
+        quiz, titles = await self.quiz_service.find_with_titles(
+            self.instructor_id, args["quiz_title"]
+        )
 
         if not quiz:
             return {
                 "success": False,
                 "message": f"Could not find quiz '{args['quiz_title']}'",
-                "available_quizzes": await self._get_available_quiz_titles(),
+                "available_quizzes": titles,
             }
 
-        analytics = await self.analytics_service.get_quiz_analytics(quiz.id)
+        analytics = await self.analytics_service.get_quiz_analytics(
+            quiz.id, student_limit=TOP_STUDENTS_LIMIT
+        )
 
         if not analytics:
             return {
@@ -289,6 +508,7 @@ Make questions educational, accurate, and appropriate for a general audience."""
             }
 
         total_q = analytics.get("total_questions", 5)
+        total_q_str = "/" + str(total_q)
         avg_score = analytics.get("average_score", 0)
 
         return {
@@ -300,39 +520,39 @@ Make questions educational, accurate, and appropriate for a general audience."""
             "question_performance": [
                 {
                     "question_number": idx + 1,
-                    "question_preview": q.get("question_text", "")[:50] + "...",
-                    "accuracy": f"{q.get('accuracy_rate', 0):.0f}%",
+                    "question_preview": _truncate50(q.get("question_text", "")),
+                    "accuracy": str(round(q.get("accuracy_rate", 0))) + "%",
                 }
                 for idx, q in enumerate(analytics.get("question_analysis", []))
             ],
             "top_students": [
                 {
                     "name": s.get("display_name") or s.get("email", "Unknown"),
-                    "best_score": f"{s.get('best_score', 0)}/{total_q}",
+                    "best_score": str(s.get("best_score", 0)) + total_q_str,
                     "attempts": s.get("attempts_count", 0),
                 }
-                for s in analytics.get("student_scores", [])[:5]
+                for s in analytics.get("student_scores", [])
             ],
         }
 
     async def _handle_edit_question(self, args: Dict[str, Any]) -> Dict[str, Any]:
         """Edit a specific question."""
-        quiz = await self._find_quiz_by_title(args["quiz_title"])
+        quiz, titles = await self.quiz_service.find_with_titles(
+            self.instructor_id, args["quiz_title"]
+        )
 
         if not quiz:
             return {
                 "success": False,
                 "message": f"Could not find quiz '{args['quiz_title']}'",
-                "available_quizzes": await self._get_available_quiz_titles(),
+                "available_quizzes": titles,
             }
 
         question_num = args["question_number"]
-        sorted_questions = sorted(quiz.questions, key=lambda q: q.order_index)
-
-        if question_num < 1 or question_num > len(sorted_questions):
+        if question_num < 1 or question_num > len(quiz.questions):
             return {
                 "success": False,
-                "message": f"Question {question_num} not found. Quiz has {len(sorted_questions)} questions.",
+                "message": f"Question {question_num} not found. Quiz has {len(quiz.questions)} questions.",
             }
 
         updated = await self.quiz_service.update_question(
@@ -384,13 +604,15 @@ Make questions educational, accurate, and appropriate for a general audience."""
 
     async def _handle_add_questions(self, args: Dict[str, Any]) -> Dict[str, Any]:
         """Add questions to an existing quiz."""
-        quiz = await self._find_quiz_by_title(args["quiz_title"])
+        quiz, titles = await self.quiz_service.find_with_titles(
+            self.instructor_id, args["quiz_title"]
+        )
 
         if not quiz:
             return {
                 "success": False,
                 "message": f"Could not find quiz '{args['quiz_title']}'",
-                "available_quizzes": await self._get_available_quiz_titles(),
+                "available_quizzes": titles,
             }
 
         topic = args.get("topic") or quiz.topic
@@ -411,7 +633,7 @@ Make questions educational, accurate, and appropriate for a general audience."""
             "success": True,
             "message": f"Added {len(new_questions)} question(s) to '{quiz.title}'",
             "questions_added": len(new_questions),
-            "total_questions": len(quiz.questions) + len(new_questions),
+            "total_questions": quiz.question_count,
             "new_questions": [
                 {
                     "number": len(quiz.questions) + idx + 1,
@@ -422,3 +644,83 @@ Make questions educational, accurate, and appropriate for a general audience."""
                 for idx, q in enumerate(new_questions)
             ],
         }
+
+    async def _handle_add_questions_bulk(self, args: Dict[str, Any]) -> Dict[str, Any]:
+        """Add questions to several quizzes using one generation call."""
+        quizzes: Dict[UUID, Quiz] = {}
+        targets = []
+        not_found = []
+        titles: List[str] = []
+        for request in args.get("requests", []):
+            quiz, titles = await self.quiz_service.find_with_titles(
+                self.instructor_id, request["quiz_title"]
+            )
+            if not quiz:
+                not_found.append(request["quiz_title"])
+                continue
+            # Requests resolving to the same quiz keep their own question set
+            # but are inserted and reported together
+            quizzes.setdefault(quiz.id, quiz)
+            targets.append(
+                (
+                    quiz.id,
+                    request.get("topic") or quiz.topic,
+                    request.get("num_questions", 1),
+                )
+            )
+
+        if not quizzes:
+            return {
+                "success": False,
+                "message": "Could not find any of the requested quizzes",
+                "not_found": not_found,
+                "available_quizzes": titles,
+            }
+
+        generated = await self._generate_question_sets(
+            [(topic, num) for _, topic, num in targets]
+        )
+        questions_by_quiz: Dict[UUID, List[Dict[str, Any]]] = {
+            quiz_id: [] for quiz_id in quizzes
+        }
+        for (quiz_id, _, _), questions in zip(targets, generated):
+            questions_by_quiz[quiz_id].extend(questions)
+
+        # Inserts run one after another: all services share one AsyncSession,
+        # which does not allow concurrent operations.
+        results = []
+        for quiz_id, quiz in quizzes.items():
+            new_questions = None
+            if questions_by_quiz[quiz_id]:
+                new_questions = await self.quiz_service.add_questions(
+                    quiz_id=quiz_id,
+                    instructor_id=self.instructor_id,
+                    questions_data=questions_by_quiz[quiz_id],
+                )
+
+            if not new_questions:
+                results.append(
+                    {
+                        "quiz_title": quiz.title,
+                        "success": False,
+                        "message": "Failed to add questions",
+                    }
+                )
+                continue
+
+            results.append(
+                {
+                    "quiz_title": quiz.title,
+                    "success": True,
+                    "questions_added": len(new_questions),
+                    "total_questions": quiz.question_count,
+                }
+            )
+
+        added = sum(r.get("questions_added", 0) for r in results)
+        return {
+            "success": any(r["success"] for r in results),
+            "message": f"Added {added} question(s) across {len(quizzes)} quiz(zes)",
+            "results": results,
+            "not_found": not_found,
+        }
@@ -1,5 +1,7 @@
 """System prompts for the AI chatbot."""
 
+from functools import lru_cache
+
 SYSTEM_PROMPT_TEMPLATE = """You are {assistant_name}, an AI assistant that helps instructors create and manage educational quizzes. Always introduce yourself as {assistant_name} when greeting users.
 
 CAPABILITIES:
@@ -30,12 +32,14 @@ QUIZ GENERATION:
 
 ADDING QUESTIONS:
 - Use add_questions tool to add 1-5 questions at a time
+- Use add_questions_bulk when adding questions to several quizzes in one request
 - No limit on total questions per quiz
 - Can specify topic or use quiz's existing topic
 
 Be helpful, educational, and professional."""
 
 
+@lru_cache(maxsize=8)
 def get_system_prompt(assistant_name: str) -> str:
-    """Generate the system prompt with the assistant's name."""
+    """Generate the system prompt with the assistant's name (cached per name)."""
     return SYSTEM_PROMPT_TEMPLATE.format(assistant_name=assistant_name)
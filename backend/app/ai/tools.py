@@ -1,5 +1,8 @@
 """Tool definitions for OpenAI function calling."""
 
+from types import MappingProxyType
+from typing import Any
+
 TOOLS = [
     {
         "type": "function",
@@ -187,4 +190,83 @@ TOOLS = [
             },
         },
     },
+    {
+        "type": "function",
+        "function": {
+            "name": "add_questions_bulk",
+            "description": "Add new questions to several existing quizzes at once",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "requests": {
+                        "type": "array",
+                        "description": "One entry per quiz to add questions to",
+                        "minItems": 1,
+                        "maxItems": 5,
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "quiz_title": {
+                                    "type": "string",
+                                    "description": "Title of the quiz",
+                                },
+                                "topic": {
+                                    "type": "string",
+                                    "description": "Topic for new questions (defaults to quiz topic)",
+                                },
+                                "num_questions": {
+                                    "type": "integer",
+                                    "description": "Number of questions to add (1-5, default 1)",
+                                    "minimum": 1,
+                                    "maximum": 5,
+                                },
+                            },
+                            "required": ["quiz_title"],
+                        },
+                    },
+                },
+                "required": ["requests"],
+            },
+        },
+    },
 ]
+
+# Parameters whose names already say everything their description would;
+# their descriptions are left out of the schema sent to the model.
+_SELF_EXPLANATORY_PARAMS = frozenset(
+    {
+        "quiz_title",
+        "new_title",
+        "description",
+        "question_text",
+        "option_a",
+        "option_b",
+        "option_c",
+        "option_d",
+        "explanation",
+        "search",
+    }
+)
+
+
+def _compact(schema: Any) -> Any:
+    """Copy a tool schema without descriptions of self-explanatory parameters."""
+    if isinstance(schema, list):
+        return [_compact(item) for item in schema]
+    if not isinstance(schema, dict):
+        return schema
+
+    compact = {key: _compact(value) for key, value in schema.items()}
+    for name, param in compact.get("properties", {}).items():
+        if name in _SELF_EXPLANATORY_PARAMS:
+            param.pop("description", None)
+    return compact
+
+
+# Smaller copy of TOOLS used for API calls, sent with every chat request
+TOOLS_COMPACT = _compact(TOOLS)
+
+# Static tool fields for every chat completion request. Passed as extra_body so
+# the OpenAI SDK merges them as-is instead of re-walking the whole schema
+# through its request-params transform on every call.
+TOOLS_REQUEST_BODY = MappingProxyType({"tools": TOOLS_COMPACT, "tool_choice": "auto"})
@@ -14,6 +14,9 @@ class Settings(BaseSettings):
     access_token_expire_minutes: int = 30
     refresh_token_expire_days: int = 7
 
+    # Password hashing
+    bcrypt_rounds: int = 12
+
     # OpenAI
     openai_api_key: str = ""
 
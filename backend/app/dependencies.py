@@ -1,7 +1,13 @@
 """Shared FastAPI dependencies."""
 
-from fastapi import Depends, HTTPException, status
+import hashlib
+import time
+from typing import Dict, Optional, Set, Tuple
+
+import httpx
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from openai import AsyncOpenAI
 from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
 
@@ -13,12 +19,65 @@ from app.utils.auth import verify_token
 
 security = HTTPBearer()
 
+# Verified tokens are remembered briefly so repeat requests with the same token
+# skip JWT verification and the users lookup. Entries never outlive the token.
+# The cache is per process: invalidate_cached_user only clears the worker that
+# handled the change, so other workers may serve the old profile for up to
+# USER_CACHE_TTL_SECONDS.
+USER_CACHE_TTL_SECONDS = 30.0
+USER_CACHE_MAX_SIZE = 10_000
+
+# sha256(access token) -> (expires_at unix time, user)
+_user_cache: Dict[bytes, Tuple[float, UserResponse]] = {}
+# user id -> keys of that user's entries in _user_cache
+_user_cache_keys: Dict[UUID, Set[bytes]] = {}
+
+
+def _uncache(key: bytes) -> None:
+    """Remove one cache entry along with its user index reference."""
+    _, user = _user_cache.pop(key)
+    keys = _user_cache_keys.get(user.id)
+    if keys is not None:
+        keys.discard(key)
+        if not keys:
+            del _user_cache_keys[user.id]
+
+
+def _cache_user(key: bytes, token_exp: float, user: UserResponse) -> None:
+    """Store a verified user, pruning expired entries when the cache is full."""
+    now = time.time()
+    if len(_user_cache) >= USER_CACHE_MAX_SIZE:
+        expired = [k for k, (expires_at, _) in _user_cache.items() if expires_at <= now]
+        for k in expired:
+            _uncache(k)
+        if len(_user_cache) >= USER_CACHE_MAX_SIZE:
+            _user_cache.clear()
+            _user_cache_keys.clear()
+    if key in _user_cache:
+        _uncache(key)
+    _user_cache[key] = (min(now + USER_CACHE_TTL_SECONDS, token_exp), user)
+    _user_cache_keys.setdefault(user.id, set()).add(key)
+
+
+def invalidate_cached_user(user_id: UUID) -> None:
+    """Drop this process's cached entries for a user, e.g. after a profile change."""
+    for key in _user_cache_keys.pop(user_id, ()):
+        _user_cache.pop(key, None)
+
 
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: AsyncSession = Depends(get_db),
 ) -> UserResponse:
     """Get the current authenticated user from JWT token."""
+    cache_key = hashlib.sha256(credentials.credentials.encode()).digest()
+    entry = _user_cache.get(cache_key)
+    if entry is not None:
+        expires_at, cached_user = entry
+        if time.time() < expires_at:
+            return cached_user
+        _uncache(cache_key)
+
     payload = verify_token(credentials.credentials, "access")
 
     if not payload:
@@ -35,7 +94,9 @@ async def get_current_user(
             detail="User not found",
         )
 
-    return UserResponse.model_validate(user)
+    user_response = UserResponse.from_user(user)
+    _cache_user(cache_key, payload["exp"], user_response)
+    return user_response
 
 
 def require_instructor(
@@ -48,3 +109,13 @@ def require_instructor(
             detail="Only instructors can perform this action",
         )
     return current_user
+
+
+def get_openai_client(request: Request) -> Optional[AsyncOpenAI]:
+    """Get the app-wide OpenAI client, or None if lifespan startup did not run."""
+    return getattr(request.app.state, "openai_client", None)
+
+
+def get_wikipedia_client(request: Request) -> Optional[httpx.AsyncClient]:
+    """Get the app-wide Wikipedia client, or None if lifespan startup did not run."""
+    return getattr(request.app.state, "wikipedia_client", None)
@@ -1,7 +1,14 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from openai import AsyncOpenAI
+from pydantic import BaseModel
 
 from app.config import get_settings
+from app.schemas import attempt, chat, quiz, user
+from app.services.wikipedia_service import create_wikipedia_client
 from app.routers import (
     auth_router,
     quiz_router,
@@ -12,10 +19,37 @@ from app.routers import (
 
 settings = get_settings()
 
+
+def build_schemas() -> None:
+    """Build deferred schema validators once per worker, before serving."""
+    for module in (attempt, chat, quiz, user):
+        for obj in vars(module).values():
+            if (
+                isinstance(obj, type)
+                and issubclass(obj, BaseModel)
+                and obj.__module__ == module.__name__
+            ):
+                obj.model_rebuild()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    build_schemas()
+    # One OpenAI client, and its connection pool, shared by all chat requests
+    app.state.openai_client = AsyncOpenAI(api_key=settings.openai_api_key)
+    # Likewise one keep-alive pool to Wikipedia for question context lookups
+    app.state.wikipedia_client = create_wikipedia_client()
+    yield
+    await app.state.openai_client.close()
+    await app.state.wikipedia_client.aclose()
+
+
 app = FastAPI(
     title="AI-Powered Knowledge Quiz Builder",
     description="API for creating and taking AI-generated quizzes",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 # CORS middleware
@@ -1,11 +1,19 @@
-import uuid
 from datetime import datetime
-from sqlalchemy import Column, Integer, Boolean, DateTime, ForeignKey, Enum as SQLEnum
+from sqlalchemy import (
+    Column,
+    Integer,
+    Boolean,
+    DateTime,
+    ForeignKey,
+    Index,
+    Enum as SQLEnum,
+)
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 import enum
 
 from app.database import Base
+from app.utils.ids import uuid7
 from app.models.quiz import AnswerOption
 
 
@@ -16,10 +24,18 @@ class AttemptStatus(str, enum.Enum):
 
 class QuizAttempt(Base):
     __tablename__ = "quiz_attempts"
+    __table_args__ = (
+        Index("ix_quiz_attempts_quiz_status", "quiz_id", "status"),
+        Index("ix_quiz_attempts_user_started", "user_id", "started_at"),
+    )
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    quiz_id = Column(UUID(as_uuid=True), ForeignKey("quizzes.id"), nullable=False)
-    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    quiz_id = Column(
+        UUID(as_uuid=True), ForeignKey("quizzes.id", ondelete="CASCADE"), nullable=False
+    )
+    user_id = Column(
+        UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+    )
     status = Column(
         SQLEnum(AttemptStatus, values_callable=lambda x: [e.value for e in x]),
         nullable=False,
@@ -33,18 +49,28 @@ class QuizAttempt(Base):
     quiz = relationship("Quiz", back_populates="attempts")
     user = relationship("User", back_populates="attempts")
     answers = relationship(
-        "AttemptAnswer", back_populates="attempt", cascade="all, delete-orphan"
+        "AttemptAnswer",
+        back_populates="attempt",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
 
 
 class AttemptAnswer(Base):
     __tablename__ = "attempt_answers"
+    __table_args__ = (Index("ix_attempt_answers_attempt_id", "attempt_id"),)
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     attempt_id = Column(
-        UUID(as_uuid=True), ForeignKey("quiz_attempts.id"), nullable=False
+        UUID(as_uuid=True),
+        ForeignKey("quiz_attempts.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    question_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("questions.id"),
+        nullable=False,
     )
-    question_id = Column(UUID(as_uuid=True), ForeignKey("questions.id"), nullable=False)
     selected_answer = Column(
         SQLEnum(AnswerOption, values_callable=lambda x: [e.value for e in x]),
         nullable=True,
@@ -1,4 +1,3 @@
-import uuid
 from datetime import datetime
 from sqlalchemy import (
     Column,
@@ -8,6 +7,7 @@ from sqlalchemy import (
     DateTime,
     Integer,
     ForeignKey,
+    Index,
     Enum as SQLEnum,
 )
 from sqlalchemy.dialects.postgresql import UUID
@@ -15,6 +15,7 @@ from sqlalchemy.orm import relationship
 import enum
 
 from app.database import Base
+from app.utils.ids import uuid7
 
 
 class AnswerOption(str, enum.Enum):
@@ -26,13 +27,26 @@ class AnswerOption(str, enum.Enum):
 
 class Quiz(Base):
     __tablename__ = "quizzes"
+    __table_args__ = (
+        Index("ix_quizzes_instructor_created", "instructor_id", "created_at"),
+        Index("ix_quizzes_published_created", "is_published", "created_at", "id"),
+        Index("ix_quizzes_published_attempts", "is_published", "attempt_count"),
+    )
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     title = Column(String(200), nullable=False)
     description = Column(Text, nullable=True)
     topic = Column(String(255), nullable=False)
-    instructor_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
+    instructor_id = Column(
+        UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+    )
     is_published = Column(Boolean, default=True)
+    # Kept in step with the questions table by QuizService, so list pages can
+    # report sizes without loading questions
+    question_count = Column(Integer, nullable=False, default=0, server_default="0")
+    # Attempts ever started on this quiz, bumped by AttemptService; orders the
+    # "popular" listing without aggregating quiz_attempts
+    attempt_count = Column(Integer, nullable=False, default=0, server_default="0")
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
@@ -42,19 +56,31 @@ class Quiz(Base):
         "Question",
         back_populates="quiz",
         cascade="all, delete-orphan",
+        passive_deletes=True,
         order_by="Question.order_index",
     )
-    tags = relationship("QuizTag", back_populates="quiz", cascade="all, delete-orphan")
+    tags = relationship(
+        "QuizTag",
+        back_populates="quiz",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+    )
     attempts = relationship(
-        "QuizAttempt", back_populates="quiz", cascade="all, delete-orphan"
+        "QuizAttempt",
+        back_populates="quiz",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
 
 
 class Question(Base):
     __tablename__ = "questions"
+    __table_args__ = (Index("ix_questions_quiz_id_order", "quiz_id", "order_index"),)
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    quiz_id = Column(UUID(as_uuid=True), ForeignKey("quizzes.id"), nullable=False)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    quiz_id = Column(
+        UUID(as_uuid=True), ForeignKey("quizzes.id", ondelete="CASCADE"), nullable=False
+    )
     question_text = Column(Text, nullable=False)
     option_a = Column(Text, nullable=False)
     option_b = Column(Text, nullable=False)
@@ -77,8 +103,13 @@ class Question(Base):
 
 class QuizTag(Base):
     __tablename__ = "quiz_tags"
+    __table_args__ = (Index("ix_quiz_tags_tag", "tag"),)
 
-    quiz_id = Column(UUID(as_uuid=True), ForeignKey("quizzes.id"), primary_key=True)
+    quiz_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("quizzes.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
     tag = Column(String(100), primary_key=True)
 
     # Relationships
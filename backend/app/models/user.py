@@ -1,4 +1,3 @@
-import uuid
 from datetime import datetime
 from sqlalchemy import Column, String, DateTime, Enum as SQLEnum
 from sqlalchemy.dialects.postgresql import UUID
@@ -6,6 +5,7 @@ from sqlalchemy.orm import relationship
 import enum
 
 from app.database import Base
+from app.utils.ids import uuid7
 
 
 class UserRole(str, enum.Enum):
@@ -21,7 +21,7 @@ class ThemePreference(str, enum.Enum):
 class User(Base):
     __tablename__ = "users"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     email = Column(String(255), unique=True, nullable=False, index=True)
     password_hash = Column(String(255), nullable=False)
     role = Column(
@@ -38,11 +38,20 @@ class User(Base):
 
     # Relationships
     quizzes = relationship(
-        "Quiz", back_populates="instructor", cascade="all, delete-orphan"
+        "Quiz",
+        back_populates="instructor",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
     attempts = relationship(
-        "QuizAttempt", back_populates="user", cascade="all, delete-orphan"
+        "QuizAttempt",
+        back_populates="user",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
     refresh_tokens = relationship(
-        "RefreshToken", back_populates="user", cascade="all, delete-orphan"
+        "RefreshToken",
+        back_populates="user",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
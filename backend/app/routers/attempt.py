@@ -8,13 +8,14 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.database import get_db
 from app.dependencies import get_current_user
 from app.schemas.attempt import (
-    AttemptAnswerSave,
     AttemptResponse,
     AttemptResultResponse,
+    AttemptSubmit,
     UserAttemptsResponse,
 )
 from app.schemas.user import UserResponse
 from app.services.attempt_service import AttemptService
+from app.utils.responses import model_json_response
 
 router = APIRouter()
 
@@ -35,13 +36,12 @@ async def start_attempt(
 @router.put("/{attempt_id}", response_model=AttemptResponse)
 async def save_progress(
     attempt_id: UUID,
-    request: dict,
+    request: AttemptSubmit,
     current_user: UserResponse = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    answers = [AttemptAnswerSave(**a) for a in request.get("answers", [])]
     attempt = await AttemptService(db).save_progress(
-        attempt_id, current_user.id, answers
+        attempt_id, current_user.id, request.answers
     )
 
     if not attempt:
@@ -56,13 +56,12 @@ async def save_progress(
 @router.post("/{attempt_id}/submit", response_model=AttemptResultResponse)
 async def submit_attempt(
     attempt_id: UUID,
-    request: dict,
+    request: AttemptSubmit,
     current_user: UserResponse = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    answers = [AttemptAnswerSave(**a) for a in request.get("answers", [])]
     result = await AttemptService(db).submit_attempt(
-        attempt_id, current_user.id, answers
+        attempt_id, current_user.id, request.answers
     )
 
     if not result:
@@ -79,7 +78,9 @@ async def get_my_attempts(
     current_user: UserResponse = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    return await AttemptService(db).get_user_attempts(current_user.id)
+    return model_json_response(
+        await AttemptService(db).get_user_attempts(current_user.id)
+    )
 
 
 @router.get("/{attempt_id}", response_model=AttemptResultResponse)
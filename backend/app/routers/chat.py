@@ -2,11 +2,21 @@
 
 import logging
 
+from typing import AsyncIterator, Optional
+
+import httpx
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
+from openai import AsyncOpenAI
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
-from app.dependencies import require_instructor
+from app.database import AsyncSessionLocal, get_db
+from app.dependencies import (
+    get_openai_client,
+    get_wikipedia_client,
+    require_instructor,
+)
 from app.schemas.chat import ChatMessage, ChatResponse
 from app.schemas.user import UserResponse
 from app.services.ai_service import AIService
@@ -15,15 +25,26 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
+def _sse_event(event: dict) -> bytes:
+    """Format one server-sent event; UUIDs in tool data become strings."""
+    return b"data: " + orjson.dumps(event, default=str) + b"\n\n"
+
+
 @router.post("", response_model=ChatResponse)
 async def chat(
     message: ChatMessage,
     current_user: UserResponse = Depends(require_instructor),
     db: AsyncSession = Depends(get_db),
+    openai_client: Optional[AsyncOpenAI] = Depends(get_openai_client),
+    wikipedia_client: Optional[httpx.AsyncClient] = Depends(get_wikipedia_client),
 ):
     try:
         result = await AIService(
-            db, current_user.id, current_user.theme_preference
+            db,
+            current_user.id,
+            current_user.theme_preference,
+            openai_client,
+            wikipedia_client,
         ).chat(message.message, message.conversation_history)
 
         return ChatResponse(
@@ -31,9 +52,45 @@ async def chat(
             action_taken=result.get("action_taken"),
             data=result.get("data"),
         )
-    except Exception as e:
+    except Exception:
+        # Full traceback goes to the log; clients get a generic message so
+        # upstream errors (keys, prompts, SQL) are never echoed back
         logger.exception("Chat error")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"AI service error: {str(e)}",
+            detail="AI service error",
         )
+
+
+@router.post("/stream")
+async def chat_stream(
+    message: ChatMessage,
+    current_user: UserResponse = Depends(require_instructor),
+    openai_client: Optional[AsyncOpenAI] = Depends(get_openai_client),
+    wikipedia_client: Optional[httpx.AsyncClient] = Depends(get_wikipedia_client),
+):
+    """Stream the assistant's reply as server-sent events."""
+
+    async def events() -> AsyncIterator[bytes]:
+        # Dependency teardown runs before the body is streamed, so the session
+        # from get_db would already be closed here; tools get their own, closed
+        # once the stream ends
+        async with AsyncSessionLocal() as db:
+            service = AIService(
+                db,
+                current_user.id,
+                current_user.theme_preference,
+                openai_client,
+                wikipedia_client,
+            )
+            try:
+                async for event in service.chat_stream(
+                    message.message, message.conversation_history
+                ):
+                    yield _sse_event(event)
+            except Exception:
+                # Headers are already sent, so report the failure as a final event
+                logger.exception("Chat stream error")
+                yield _sse_event({"type": "error", "detail": "AI service error"})
+
+    return StreamingResponse(events(), media_type="text/event-stream")
@@ -19,6 +19,7 @@ from app.schemas.quiz import (
 from app.schemas.user import UserResponse
 from app.services.analytics_service import AnalyticsService
 from app.services.quiz_service import QuizService
+from app.utils.responses import model_json_response
 
 router = APIRouter()
 
@@ -30,11 +31,21 @@ async def list_quizzes(
     sort: SortOrder = Query(SortOrder.NEWEST),
     page: int = Query(1, ge=1),
     page_size: int = Query(10, ge=1, le=100),
+    cursor: Optional[str] = Query(None),
     db: AsyncSession = Depends(get_db),
 ):
-    return await QuizService(db).list_quizzes(
-        search=search, tags=tags, sort=sort, page=page, page_size=page_size
-    )
+    try:
+        result = await QuizService(db).list_quizzes(
+            search=search,
+            tags=tags,
+            sort=sort,
+            page=page,
+            page_size=page_size,
+            cursor=cursor,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return model_json_response(result)
 
 
 @router.get("/my", response_model=QuizListResponse)
@@ -42,7 +53,9 @@ async def get_my_quizzes(
     current_user: UserResponse = Depends(require_instructor),
     db: AsyncSession = Depends(get_db),
 ):
-    return await QuizService(db).get_instructor_quizzes(current_user.id)
+    return model_json_response(
+        await QuizService(db).get_instructor_quizzes(current_user.id)
+    )
 
 
 @router.get("/my/stats")
@@ -68,8 +81,8 @@ async def get_quiz(
 
     # Instructor sees full details, others see student view (no answers)
     if quiz.instructor_id == current_user.id:
-        return QuizResponse.from_orm_with_tags(quiz)
-    return QuizResponseForStudent.from_orm_with_tags(quiz)
+        return model_json_response(QuizResponse.from_orm_with_tags(quiz))
+    return model_json_response(QuizResponseForStudent.from_orm_with_tags(quiz))
 
 
 @router.post("", response_model=QuizResponse, status_code=status.HTTP_201_CREATED)
@@ -118,20 +131,23 @@ async def delete_quiz(
 @router.get("/{quiz_id}/analytics")
 async def get_quiz_analytics(
     quiz_id: UUID,
+    student_limit: Optional[int] = Query(None, ge=1),
     current_user: UserResponse = Depends(require_instructor),
     db: AsyncSession = Depends(get_db),
 ):
-    quiz = await QuizService(db).get_quiz_by_id(quiz_id)
+    instructor_id = await QuizService(db).get_quiz_owner_id(quiz_id)
 
-    if not quiz:
+    if not instructor_id:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Quiz not found"
         )
 
-    if quiz.instructor_id != current_user.id:
+    if instructor_id != current_user.id:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="You don't have permission to view analytics for this quiz",
         )
 
-    return await AnalyticsService(db).get_quiz_analytics(quiz_id)
+    return await AnalyticsService(db).get_quiz_analytics(
+        quiz_id, student_limit=student_limit
+    )
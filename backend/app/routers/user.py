@@ -5,7 +5,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
-from app.dependencies import get_current_user
+from app.dependencies import get_current_user, invalidate_cached_user
 from app.models.user import User
 from app.schemas.user import UserResponse, UserUpdate
 
@@ -39,5 +39,6 @@ async def update_profile(
 
     await db.commit()
     await db.refresh(user)
+    invalidate_cached_user(user.id)
 
-    return UserResponse.model_validate(user)
+    return UserResponse.from_user(user)
@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from uuid import UUID
 from datetime import datetime
 from typing import Optional, List
@@ -25,8 +25,7 @@ class AttemptAnswerResponse(BaseModel):
     selected_answer: Optional[AnswerOption]
     is_correct: Optional[bool]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(defer_build=True, from_attributes=True)
 
 
 class AttemptResponse(BaseModel):
@@ -38,8 +37,7 @@ class AttemptResponse(BaseModel):
     completed_at: Optional[datetime]
     answers: List[AttemptAnswerResponse]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(defer_build=True, from_attributes=True)
 
 
 class QuestionResultResponse(BaseModel):
@@ -77,8 +75,7 @@ class AttemptSummary(BaseModel):
     started_at: datetime
     completed_at: Optional[datetime]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(defer_build=True, from_attributes=True)
 
 
 class UserAttemptsResponse(BaseModel):
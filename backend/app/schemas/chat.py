@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import Optional, List, Any
+from typing import Optional, List, Any, Dict
 
 
 class ChatMessage(BaseModel):
@@ -10,4 +10,5 @@ class ChatMessage(BaseModel):
 class ChatResponse(BaseModel):
     response: str
     action_taken: Optional[str] = None
-    data: Optional[Any] = None
+    # Tool handlers always return a JSON object; its keys vary by tool
+    data: Optional[Dict[str, Any]] = None
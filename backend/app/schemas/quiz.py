@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 from uuid import UUID
 from datetime import datetime
 from typing import Optional, List
@@ -18,13 +18,14 @@ class QuestionCreate(BaseModel):
 
     @model_validator(mode="after")
     def validate_no_duplicate_options(self):
-        options = [
+        # A set display builds the set directly, with no intermediate list
+        options = {
             self.option_a.strip().lower(),
             self.option_b.strip().lower(),
             self.option_c.strip().lower(),
             self.option_d.strip().lower(),
-        ]
-        if len(options) != len(set(options)):
+        }
+        if len(options) != 4:
             raise ValueError(
                 "All answer options must be unique (no duplicates allowed)"
             )
@@ -42,8 +43,22 @@ class QuestionResponse(BaseModel):
     explanation: Optional[str]
     order_index: int
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(defer_build=True, from_attributes=True)
+
+    @classmethod
+    def from_question(cls, question) -> "QuestionResponse":
+        """Build from a loaded Question row without re-validating DB values."""
+        return cls.model_construct(
+            id=question.id,
+            question_text=question.question_text,
+            option_a=question.option_a,
+            option_b=question.option_b,
+            option_c=question.option_c,
+            option_d=question.option_d,
+            correct_answer=question.correct_answer,
+            explanation=question.explanation,
+            order_index=question.order_index,
+        )
 
 
 class QuestionResponseForStudent(BaseModel):
@@ -57,8 +72,20 @@ class QuestionResponseForStudent(BaseModel):
     option_d: str
     order_index: int
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(defer_build=True, from_attributes=True)
+
+    @classmethod
+    def from_question(cls, question) -> "QuestionResponseForStudent":
+        """Build from a loaded Question row without re-validating DB values."""
+        return cls.model_construct(
+            id=question.id,
+            question_text=question.question_text,
+            option_a=question.option_a,
+            option_b=question.option_b,
+            option_c=question.option_c,
+            option_d=question.option_d,
+            order_index=question.order_index,
+        )
 
 
 class QuestionUpdate(BaseModel):
@@ -84,8 +111,14 @@ class QuizInstructorInfo(BaseModel):
     display_name: Optional[str]
     email: str
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(defer_build=True, from_attributes=True)
+
+    @classmethod
+    def from_user(cls, user) -> "QuizInstructorInfo":
+        """Build from a loaded User row without re-validating DB values."""
+        return cls.model_construct(
+            id=user.id, display_name=user.display_name, email=user.email
+        )
 
 
 class QuizResponse(BaseModel):
@@ -100,19 +133,18 @@ class QuizResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(defer_build=True, from_attributes=True)
 
     @classmethod
     def from_orm_with_tags(cls, quiz):
-        return cls(
+        return cls.model_construct(
             id=quiz.id,
             title=quiz.title,
             description=quiz.description,
             topic=quiz.topic,
             tags=[t.tag for t in quiz.tags],
-            questions=quiz.questions,
-            instructor=quiz.instructor,
+            questions=[QuestionResponse.from_question(q) for q in quiz.questions],
+            instructor=QuizInstructorInfo.from_user(quiz.instructor),
             is_published=quiz.is_published,
             created_at=quiz.created_at,
             updated_at=quiz.updated_at,
@@ -133,21 +165,20 @@ class QuizResponseForStudent(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(defer_build=True, from_attributes=True)
 
     @classmethod
     def from_orm_with_tags(cls, quiz):
-        return cls(
+        return cls.model_construct(
             id=quiz.id,
             title=quiz.title,
             description=quiz.description,
             topic=quiz.topic,
             tags=[t.tag for t in quiz.tags],
             questions=[
-                QuestionResponseForStudent.model_validate(q) for q in quiz.questions
+                QuestionResponseForStudent.from_question(q) for q in quiz.questions
             ],
-            instructor=quiz.instructor,
+            instructor=QuizInstructorInfo.from_user(quiz.instructor),
             is_published=quiz.is_published,
             created_at=quiz.created_at,
             updated_at=quiz.updated_at,
@@ -165,8 +196,7 @@ class QuizListItem(BaseModel):
     created_at: datetime
     question_count: int = 5
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(defer_build=True, from_attributes=True)
 
 
 class QuizListResponse(BaseModel):
@@ -174,6 +204,7 @@ class QuizListResponse(BaseModel):
     total: int
     page: int
     page_size: int
+    next_cursor: Optional[str] = None
 
 
 class QuizUpdate(BaseModel):
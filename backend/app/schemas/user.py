@@ -1,11 +1,12 @@
-from pydantic import BaseModel, EmailStr, field_validator
+from pydantic import BaseModel, ConfigDict, EmailStr, field_validator
 from uuid import UUID
 from datetime import datetime
 from typing import Optional
-import re
 
 from app.models.user import UserRole, ThemePreference
 
+_SPECIAL_CHARS = frozenset('!@#$%^&*(),.?":{}|<>')
+
 
 class UserCreate(BaseModel):
     email: EmailStr
@@ -18,9 +19,10 @@ class UserCreate(BaseModel):
     def validate_password(cls, v: str) -> str:
         if len(v) < 8:
             raise ValueError("Password must be at least 8 characters long")
-        if not re.search(r"\d", v):
+        # isdecimal() accepts the same characters as the regex \d class
+        if not any(c.isdecimal() for c in v):
             raise ValueError("Password must contain at least 1 number")
-        if not re.search(r"[!@#$%^&*(),.?\":{}|<>]", v):
+        if _SPECIAL_CHARS.isdisjoint(v):
             raise ValueError("Password must contain at least 1 special character")
         return v
 
@@ -38,8 +40,19 @@ class UserResponse(BaseModel):
     theme_preference: ThemePreference
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(defer_build=True, from_attributes=True)
+
+    @classmethod
+    def from_user(cls, user) -> "UserResponse":
+        """Build from a loaded User row, skipping validation of trusted DB values."""
+        return cls.model_construct(
+            id=user.id,
+            email=user.email,
+            role=user.role,
+            display_name=user.display_name,
+            theme_preference=user.theme_preference,
+            created_at=user.created_at,
+        )
 
 
 class UserUpdate(BaseModel):
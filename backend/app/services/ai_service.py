@@ -1,15 +1,17 @@
 """AI service for chatbot interactions."""
 
-import json
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 from uuid import UUID
 
+import httpx
+import orjson
 from openai import AsyncOpenAI
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.ai.handlers import ToolHandler
 from app.ai.prompts import get_system_prompt
-from app.ai.tools import TOOLS
+from app.ai.tools import TOOLS_REQUEST_BODY
 from app.config import get_settings
 from app.services.analytics_service import AnalyticsService
 from app.services.quiz_service import QuizService
@@ -23,23 +25,41 @@ ASSISTANT_NAMES = {
     "utah": "Swoop the Ute",
 }
 
+# Per-assistant request body: the tools plus a prompt_cache_key, so turns that
+# share a system prompt are routed to the same cached prompt prefix
+REQUEST_BODIES = {
+    name: MappingProxyType({**TOOLS_REQUEST_BODY, "prompt_cache_key": f"kqb:{name}"})
+    for name in ASSISTANT_NAMES.values()
+}
+
 
 class AIService:
     """Service for AI-powered quiz chatbot."""
 
     def __init__(
-        self, db: AsyncSession, instructor_id: UUID, theme_preference: str = "byu"
+        self,
+        db: AsyncSession,
+        instructor_id: UUID,
+        theme_preference: str = "byu",
+        openai_client: Optional[AsyncOpenAI] = None,
+        wikipedia_client: Optional[httpx.AsyncClient] = None,
     ):
         self.instructor_id = instructor_id
-        self.client = AsyncOpenAI(api_key=settings.openai_api_key)
+        self.client = openai_client or AsyncOpenAI(api_key=settings.openai_api_key)
         self.assistant_name = ASSISTANT_NAMES.get(
             theme_preference, ASSISTANT_NAMES["byu"]
         )
+        self._request_body = REQUEST_BODIES[self.assistant_name]
+        # Built once per service; shared read-only by every message list
+        self._system_message = {
+            "role": "system",
+            "content": get_system_prompt(self.assistant_name),
+        }
 
         self.tool_handler = ToolHandler(
             quiz_service=QuizService(db),
             analytics_service=AnalyticsService(db),
-            wikipedia_service=WikipediaService(),
+            wikipedia_service=WikipediaService(wikipedia_client),
             openai_client=self.client,
             instructor_id=instructor_id,
         )
@@ -53,8 +73,7 @@ class AIService:
         response = await self.client.chat.completions.create(
             model="gpt-4o",
             messages=messages,
-            tools=TOOLS,
-            tool_choice="auto",
+            extra_body=self._request_body,
         )
 
         assistant_message = response.choices[0].message
@@ -65,27 +84,20 @@ class AIService:
         while assistant_message.tool_calls:
             messages.append(assistant_message.model_dump())
 
-            for tool_call in assistant_message.tool_calls:
-                tool_name = tool_call.function.name
-                arguments = self._parse_arguments(tool_call.function.arguments)
-
-                result = await self.tool_handler.execute(tool_name, arguments)
+            for tool_name, result in await self._run_tool_calls(
+                [
+                    (tc.id, tc.function.name, tc.function.arguments)
+                    for tc in assistant_message.tool_calls
+                ],
+                messages,
+            ):
                 actions_taken.append(tool_name)
                 all_data.append(result)
 
-                messages.append(
-                    {
-                        "role": "tool",
-                        "tool_call_id": tool_call.id,
-                        "content": json.dumps(result),
-                    }
-                )
-
             response = await self.client.chat.completions.create(
                 model="gpt-4o",
                 messages=messages,
-                tools=TOOLS,
-                tool_choice="auto",
+                extra_body=self._request_body,
             )
             assistant_message = response.choices[0].message
 
@@ -95,13 +107,119 @@ class AIService:
             "data": all_data[-1] if all_data else None,
         }
 
+    async def chat_stream(
+        self, message: str, conversation_history: Optional[List[Dict[str, str]]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Process a chat message, yielding events as the model streams.
+
+        Yields ``{"type": "token", "content": ...}`` for each text fragment,
+        ``{"type": "action", "action_taken": ...}`` after each tool runs, and a
+        final ``{"type": "done", "action_taken": ..., "data": ...}``.
+        """
+        messages = self._build_messages(message, conversation_history)
+        actions_taken = []
+        all_data = []
+
+        while True:
+            stream = await self.client.chat.completions.create(
+                model="gpt-4o",
+                messages=messages,
+                extra_body=self._request_body,
+                stream=True,
+            )
+
+            content_parts: List[str] = []
+            # Tool calls arrive in fragments keyed by their index in the turn
+            tool_calls: Dict[int, Dict[str, str]] = {}
+            finish_reason = None
+
+            async for chunk in stream:
+                if not chunk.choices:
+                    continue
+                choice = chunk.choices[0]
+                delta = choice.delta
+                if delta.content:
+                    content_parts.append(delta.content)
+                    yield {"type": "token", "content": delta.content}
+                for fragment in delta.tool_calls or ():
+                    call = tool_calls.setdefault(
+                        fragment.index, {"id": "", "name": "", "arguments": ""}
+                    )
+                    if fragment.id:
+                        call["id"] = fragment.id
+                    if fragment.function:
+                        call["name"] += fragment.function.name or ""
+                        call["arguments"] += fragment.function.arguments or ""
+                if choice.finish_reason:
+                    finish_reason = choice.finish_reason
+
+            if finish_reason != "tool_calls" or not tool_calls:
+                break
+
+            ordered_calls = [tool_calls[i] for i in sorted(tool_calls)]
+            messages.append(
+                {
+                    "role": "assistant",
+                    "content": "".join(content_parts) or None,
+                    "tool_calls": [
+                        {
+                            "id": call["id"],
+                            "type": "function",
+                            "function": {
+                                "name": call["name"],
+                                "arguments": call["arguments"],
+                            },
+                        }
+                        for call in ordered_calls
+                    ],
+                }
+            )
+
+            for tool_name, result in await self._run_tool_calls(
+                [
+                    (call["id"], call["name"], call["arguments"])
+                    for call in ordered_calls
+                ],
+                messages,
+            ):
+                actions_taken.append(tool_name)
+                all_data.append(result)
+                yield {"type": "action", "action_taken": tool_name}
+
+        yield {
+            "type": "done",
+            "action_taken": actions_taken[-1] if actions_taken else None,
+            "data": all_data[-1] if all_data else None,
+        }
+
+    async def _run_tool_calls(
+        self, tool_calls: List[Tuple[str, str, str]], messages: List[Dict[str, Any]]
+    ) -> List[Tuple[str, Any]]:
+        """Execute (id, name, arguments) tool calls and append their results."""
+        results = await self.tool_handler.execute_many(
+            [
+                (tool_name, self._parse_arguments(arguments_str))
+                for _, tool_name, arguments_str in tool_calls
+            ]
+        )
+        for (tool_call_id, _, _), result in zip(tool_calls, results):
+            messages.append(
+                {
+                    "role": "tool",
+                    "tool_call_id": tool_call_id,
+                    "content": orjson.dumps(result, default=str).decode(),
+                }
+            )
+        return [
+            (tool_name, result)
+            for (_, tool_name, _), result in zip(tool_calls, results)
+        ]
+
     def _build_messages(
         self, message: str, history: Optional[List[Dict[str, str]]]
     ) -> List[Dict[str, str]]:
         """Build message list for OpenAI API."""
-        messages = [
-            {"role": "system", "content": get_system_prompt(self.assistant_name)}
-        ]
+        messages = [self._system_message]
 
         if history:
             for msg in history:
@@ -121,6 +239,6 @@ class AIService:
         if not arguments_str:
             return {}
         try:
-            return json.loads(arguments_str)
-        except json.JSONDecodeError:
+            return orjson.loads(arguments_str)
+        except orjson.JSONDecodeError:
             return {}
@@ -1,11 +1,38 @@
+import time
 from uuid import UUID
-from typing import Dict
-from sqlalchemy import select, and_
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import ColumnElement, select, and_, case, desc, distinct, func
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.models.quiz import Quiz
-from app.models.attempt import QuizAttempt, AttemptStatus
+from app.models.attempt import QuizAttempt, AttemptAnswer, AttemptStatus
+from app.models.user import User
+
+# Quiz attempt aggregates are kept briefly so dashboard refreshes skip the
+# GROUP BY queries while no new attempt has been completed
+ANALYTICS_CACHE_TTL_SECONDS = 60.0
+ANALYTICS_CACHE_MAX_SIZE = 1_000
+
+# (score rows, per-question answer rows, per-student rows)
+AttemptAggregates = Tuple[List[tuple], List[tuple], List[tuple]]
+
+# (quiz_id, completed attempt count, latest completed_at) -> (expires_at, rows)
+_aggregates_cache: Dict[tuple, Tuple[float, AttemptAggregates]] = {}
+
+
+def _cache_aggregates(key: tuple, aggregates: AttemptAggregates) -> None:
+    """Store quiz aggregates, pruning expired entries when the cache is full."""
+    now = time.monotonic()
+    if len(_aggregates_cache) >= ANALYTICS_CACHE_MAX_SIZE:
+        expired = [
+            k for k, (expires_at, _) in _aggregates_cache.items() if expires_at <= now
+        ]
+        for k in expired:
+            del _aggregates_cache[k]
+        if len(_aggregates_cache) >= ANALYTICS_CACHE_MAX_SIZE:
+            _aggregates_cache.clear()
+    _aggregates_cache[key] = (now + ANALYTICS_CACHE_TTL_SECONDS, aggregates)
 
 
 class QuestionAnalysis:
@@ -44,7 +71,14 @@ class AnalyticsService:
     def __init__(self, db: AsyncSession):
         self.db = db
 
-    async def get_quiz_analytics(self, quiz_id: UUID) -> dict:
+    async def get_quiz_analytics(
+        self, quiz_id: UUID, student_limit: Optional[int] = None
+    ) -> dict:
+        """Get attempt statistics for a quiz.
+
+        student_scores is the leaderboard, best score first; student_limit
+        keeps only its top entries. unique_students always counts everyone.
+        """
         # Get quiz with questions
         quiz_result = await self.db.execute(
             select(Quiz).options(selectinload(Quiz.questions)).where(Quiz.id == quiz_id)
@@ -54,96 +88,65 @@ class AnalyticsService:
         if not quiz:
             return {}
 
-        # Get all completed attempts (excluding the instructor's own attempts)
-        attempts_result = await self.db.execute(
-            select(QuizAttempt)
-            .options(selectinload(QuizAttempt.answers), selectinload(QuizAttempt.user))
-            .where(
-                and_(
-                    QuizAttempt.quiz_id == quiz_id,
-                    QuizAttempt.status == AttemptStatus.COMPLETED,
-                    QuizAttempt.user_id != quiz.instructor_id,  # Exclude instructor
-                )
-            )
+        # Only completed attempts count, and the instructor's own are excluded
+        attempt_filter = and_(
+            QuizAttempt.quiz_id == quiz_id,
+            QuizAttempt.status == AttemptStatus.COMPLETED,
+            QuizAttempt.user_id != quiz.instructor_id,
         )
-        attempts = attempts_result.scalars().all()
-
-        total_attempts = len(attempts)
-        unique_users = set(a.user_id for a in attempts)
-        unique_students = len(unique_users)
-
-        # Calculate average score
-        scores = [a.score for a in attempts if a.score is not None]
-        average_score = sum(scores) / len(scores) if scores else 0
         total_questions = len(quiz.questions)
 
+        score_rows, answer_rows, student_rows = await self._attempt_aggregates(
+            quiz_id, attempt_filter
+        )
+
+        total_attempts = 0
+        scored_attempts = 0
+        score_sum = 0
         # Score distribution (0 to total_questions)
         score_distribution: Dict[int, int] = {i: 0 for i in range(total_questions + 1)}
-        for score in scores:
+        for score, count in score_rows:
+            total_attempts += count
             if score is not None:
-                score_distribution[score] = score_distribution.get(score, 0) + 1
-
-        # Question analysis - sort by order_index for correct Q1, Q2, Q3 labeling
-        sorted_questions = sorted(quiz.questions, key=lambda q: q.order_index)
-        question_stats: Dict[str, Dict] = {}
-        for question in sorted_questions:
-            question_stats[str(question.id)] = {
-                "question_text": question.question_text,
-                "order_index": question.order_index,
-                "correct": 0,
-                "incorrect": 0,
-            }
+                scored_attempts += count
+                score_sum += score * count
+                score_distribution[score] = count
+        average_score = score_sum / scored_attempts if scored_attempts else 0
+        unique_students = len(student_rows)
 
-        for attempt in attempts:
-            for answer in attempt.answers:
-                qid = str(answer.question_id)
-                if qid in question_stats:
-                    if answer.is_correct:
-                        question_stats[qid]["correct"] += 1
-                    else:
-                        question_stats[qid]["incorrect"] += 1
-
-        # Build list sorted by order_index
-        question_analysis = sorted(
-            [
+        # Question analysis - Quiz.questions loads in order_index order, which
+        # gives the correct Q1, Q2, Q3 labeling
+        answer_counts = {
+            question_id: (correct, answered)
+            for question_id, correct, answered in answer_rows
+        }
+        question_analysis = []
+        for question in quiz.questions:
+            correct, answered = answer_counts.get(question.id, (0, 0))
+            question_analysis.append(
                 {
-                    "question_id": qid,
-                    "question_text": stats["question_text"],
-                    "order_index": stats["order_index"],
-                    "correct_count": stats["correct"],
-                    "incorrect_count": stats["incorrect"],
-                    "accuracy_rate": (
-                        stats["correct"] / (stats["correct"] + stats["incorrect"]) * 100
-                        if (stats["correct"] + stats["incorrect"]) > 0
-                        else 0
-                    ),
+                    "question_id": str(question.id),
+                    "question_text": question.question_text,
+                    "order_index": question.order_index,
+                    "correct_count": correct,
+                    "incorrect_count": answered - correct,
+                    "accuracy_rate": correct / answered * 100 if answered > 0 else 0,
                 }
-                for qid, stats in question_stats.items()
-            ],
-            key=lambda x: x["order_index"],
-        )
+            )
 
-        # Student scores (best score per student)
-        student_scores_map: Dict[str, Dict] = {}
-        for attempt in attempts:
-            uid = str(attempt.user_id)
-            if uid not in student_scores_map:
-                student_scores_map[uid] = {
-                    "user_id": attempt.user_id,
-                    "display_name": attempt.user.display_name,
-                    "email": attempt.user.email,
-                    "best_score": attempt.score or 0,
-                    "attempts_count": 1,
-                }
-            else:
-                student_scores_map[uid]["attempts_count"] += 1
-                if (attempt.score or 0) > student_scores_map[uid]["best_score"]:
-                    student_scores_map[uid]["best_score"] = attempt.score or 0
-
-        # Sort by best score descending for leaderboard
-        student_scores = sorted(
-            student_scores_map.values(), key=lambda x: x["best_score"], reverse=True
-        )
+        # Student scores (best score per student), highest first for leaderboard
+        student_scores = [
+            {
+                "user_id": user_id,
+                "display_name": display_name,
+                "email": email,
+                "best_score": best_score,
+                "attempts_count": attempts_count,
+            }
+            for user_id, display_name, email, best_score, attempts_count in (
+                student_rows[:student_limit]
+            )
+        ]
 
         return {
             "quiz_id": str(quiz_id),
@@ -157,18 +160,81 @@ class AnalyticsService:
             "student_scores": student_scores,
         }
 
+    async def _attempt_aggregates(
+        self, quiz_id: UUID, attempt_filter: ColumnElement[bool]
+    ) -> AttemptAggregates:
+        """Score, per-question and per-student aggregates for a quiz's attempts.
+
+        Served from a short-lived cache while the quiz's completed attempts are
+        unchanged, checked with a cheap COUNT/MAX(completed_at) fingerprint.
+        """
+        fingerprint = (
+            await self.db.execute(
+                select(func.count(), func.max(QuizAttempt.completed_at)).where(
+                    attempt_filter
+                )
+            )
+        ).one()
+        cache_key = (quiz_id, fingerprint[0], fingerprint[1])
+        entry = _aggregates_cache.get(cache_key)
+        if entry is not None:
+            expires_at, cached = entry
+            if time.monotonic() < expires_at:
+                return cached
+            del _aggregates_cache[cache_key]
+
+        # Aggregate in SQL rather than hydrating every attempt and answer. The
+        # queries run one after another because they share this session.
+        score_rows = (
+            await self.db.execute(
+                select(QuizAttempt.score, func.count())
+                .where(attempt_filter)
+                .group_by(QuizAttempt.score)
+            )
+        ).all()
+        answer_rows = (
+            await self.db.execute(
+                select(
+                    AttemptAnswer.question_id,
+                    func.count().filter(AttemptAnswer.is_correct.is_(True)),
+                    func.count(),
+                )
+                .join(QuizAttempt, AttemptAnswer.attempt_id == QuizAttempt.id)
+                .where(attempt_filter)
+                .group_by(AttemptAnswer.question_id)
+            )
+        ).all()
+        student_rows = (
+            await self.db.execute(
+                select(
+                    QuizAttempt.user_id,
+                    User.display_name,
+                    User.email,
+                    func.coalesce(func.max(QuizAttempt.score), 0).label("best_score"),
+                    func.count(),
+                )
+                .join(User, QuizAttempt.user_id == User.id)
+                .where(attempt_filter)
+                .group_by(QuizAttempt.user_id, User.display_name, User.email)
+                .order_by(desc("best_score"))
+            )
+        ).all()
+
+        aggregates = (
+            [tuple(row) for row in score_rows],
+            [tuple(row) for row in answer_rows],
+            [tuple(row) for row in student_rows],
+        )
+        _cache_aggregates(cache_key, aggregates)
+        return aggregates
+
     async def get_instructor_dashboard_stats(self, instructor_id: UUID) -> dict:
         """Get aggregated stats for an instructor's dashboard."""
-        # Get all quizzes by this instructor with questions loaded
-        quizzes_result = await self.db.execute(
-            select(Quiz)
-            .options(selectinload(Quiz.questions))
-            .where(Quiz.instructor_id == instructor_id)
+        total_quizzes = await self.db.scalar(
+            select(func.count()).where(Quiz.instructor_id == instructor_id)
         )
-        quizzes = quizzes_result.scalars().all()
-        quiz_ids = [q.id for q in quizzes]
 
-        if not quiz_ids:
+        if not total_quizzes:
             return {
                 "total_quizzes": 0,
                 "total_students": 0,
@@ -176,37 +242,40 @@ class AnalyticsService:
                 "average_percentage": 0,
             }
 
-        # Create a map of quiz_id to question count
-        quiz_question_counts = {q.id: len(q.questions) for q in quizzes}
-
-        # Get all completed attempts for these quizzes (excluding instructor's own)
-        attempts_result = await self.db.execute(
-            select(QuizAttempt).where(
-                and_(
-                    QuizAttempt.quiz_id.in_(quiz_ids),
-                    QuizAttempt.status == AttemptStatus.COMPLETED,
-                    QuizAttempt.user_id != instructor_id,
-                )
+        # Percentage per attempt is score / question count; attempts without a
+        # score or on quizzes without questions are left out of the average
+        percentage = case(
+            (
+                Quiz.question_count > 0,
+                QuizAttempt.score * 100.0 / Quiz.question_count,
             )
         )
-        attempts = attempts_result.scalars().all()
-
-        total_attempts = len(attempts)
-        unique_students = len(set(a.user_id for a in attempts))
 
-        # Calculate average percentage (score / total_questions * 100 for each attempt)
-        percentages = []
-        for a in attempts:
-            if a.score is not None:
-                total_q = quiz_question_counts.get(a.quiz_id, 5)
-                if total_q > 0:
-                    percentages.append((a.score / total_q) * 100)
-
-        average_percentage = sum(percentages) / len(percentages) if percentages else 0
+        # Completed attempts on this instructor's quizzes, excluding their own
+        totals = (
+            await self.db.execute(
+                select(
+                    func.count(),
+                    func.count(distinct(QuizAttempt.user_id)),
+                    func.avg(percentage),
+                )
+                .select_from(QuizAttempt)
+                .join(Quiz, QuizAttempt.quiz_id == Quiz.id)
+                .where(
+                    and_(
+                        Quiz.instructor_id == instructor_id,
+                        QuizAttempt.status == AttemptStatus.COMPLETED,
+                        QuizAttempt.user_id != instructor_id,
+                    )
+                )
+            )
+        ).one()
+        total_attempts, unique_students, average_percentage = totals
 
         return {
-            "total_quizzes": len(quizzes),
+            "total_quizzes": total_quizzes,
             "total_students": unique_students,
             "total_attempts": total_attempts,
-            "average_percentage": round(average_percentage, 1),
+            # Postgres returns NUMERIC (Decimal) for the average
+            "average_percentage": round(float(average_percentage or 0), 1),
         }
@@ -1,9 +1,10 @@
 from uuid import UUID
 from typing import Optional, List
 from datetime import datetime
-from sqlalchemy import select, and_
+from sqlalchemy import select, and_, insert, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import raiseload, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
 from app.models.quiz import Quiz
 from app.models.attempt import QuizAttempt, AttemptAnswer, AttemptStatus
@@ -25,7 +26,9 @@ class AttemptService:
         # Use scalars().first() to handle case where multiple in-progress attempts exist
         result = await self.db.execute(
             select(QuizAttempt)
-            .options(selectinload(QuizAttempt.answers))
+            .options(
+                selectinload(QuizAttempt.answers), raiseload("*", sql_only=True)
+            )
             .where(
                 and_(
                     QuizAttempt.quiz_id == quiz_id,
@@ -42,7 +45,9 @@ class AttemptService:
 
         # Get quiz questions
         quiz_result = await self.db.execute(
-            select(Quiz).options(selectinload(Quiz.questions)).where(Quiz.id == quiz_id)
+            select(Quiz)
+            .options(selectinload(Quiz.questions), raiseload("*", sql_only=True))
+            .where(Quiz.id == quiz_id)
         )
         quiz = quiz_result.scalar_one_or_none()
 
@@ -58,33 +63,45 @@ class AttemptService:
         self.db.add(attempt)
         await self.db.flush()
 
-        # Create empty answer slots for each question
-        for question in quiz.questions:
-            answer = AttemptAnswer(
-                attempt_id=attempt.id,
-                question_id=question.id,
-                selected_answer=None,
-                is_correct=None,
+        # Keep the popularity counter in step; updated_at is pinned so starting
+        # an attempt does not read as an edit to the quiz
+        await self.db.execute(
+            update(Quiz)
+            .where(Quiz.id == quiz_id)
+            .values(attempt_count=Quiz.attempt_count + 1, updated_at=Quiz.updated_at)
+        )
+
+        # Create empty answer slots for each question in a single multi-row INSERT,
+        # keeping the returned rows so the attempt needs no reload afterwards
+        answers: List[AttemptAnswer] = []
+        if quiz.questions:
+            result = await self.db.scalars(
+                insert(AttemptAnswer).returning(AttemptAnswer),
+                [
+                    {
+                        "attempt_id": attempt.id,
+                        "question_id": question.id,
+                        "selected_answer": None,
+                        "is_correct": None,
+                    }
+                    for question in quiz.questions
+                ],
             )
-            self.db.add(answer)
+            answers = list(result)
 
         await self.db.commit()
         await self.db.refresh(attempt)
-
-        # Reload with relationships
-        result = await self.db.execute(
-            select(QuizAttempt)
-            .options(selectinload(QuizAttempt.answers))
-            .where(QuizAttempt.id == attempt.id)
-        )
-        return result.scalar_one()
+        set_committed_value(attempt, "answers", answers)
+        return attempt
 
     async def save_progress(
         self, attempt_id: UUID, user_id: UUID, answers: List[AttemptAnswerSave]
     ) -> Optional[QuizAttempt]:
         result = await self.db.execute(
             select(QuizAttempt)
-            .options(selectinload(QuizAttempt.answers))
+            .options(
+                selectinload(QuizAttempt.answers), raiseload("*", sql_only=True)
+            )
             .where(
                 and_(
                     QuizAttempt.id == attempt_id,
@@ -99,22 +116,16 @@ class AttemptService:
             return None
 
         # Update answers
-        answer_map = {str(a.question_id): a for a in attempt.answers}
+        answer_map = {a.question_id: a for a in attempt.answers}
         for ans_data in answers:
-            if str(ans_data.question_id) in answer_map:
-                answer_map[
-                    str(ans_data.question_id)
-                ].selected_answer = ans_data.selected_answer
+            answer = answer_map.get(ans_data.question_id)
+            if answer is not None:
+                answer.selected_answer = ans_data.selected_answer
 
+        # The session keeps loaded values after commit (expire_on_commit=False),
+        # so the attempt and its answers are already current
         await self.db.commit()
-
-        # Reload the attempt with its answers to get fresh data
-        result = await self.db.execute(
-            select(QuizAttempt)
-            .options(selectinload(QuizAttempt.answers))
-            .where(QuizAttempt.id == attempt_id)
-        )
-        return result.scalar_one()
+        return attempt
 
     async def submit_attempt(
         self, attempt_id: UUID, user_id: UUID, answers: List[AttemptAnswerSave]
@@ -124,6 +135,7 @@ class AttemptService:
             .options(
                 selectinload(QuizAttempt.answers),
                 selectinload(QuizAttempt.quiz).selectinload(Quiz.questions),
+                raiseload("*", sql_only=True),
             )
             .where(
                 and_(
@@ -139,24 +151,42 @@ class AttemptService:
             return None
 
         # Build question map for correct answers
-        question_map = {str(q.id): q for q in attempt.quiz.questions}
-        answer_map = {str(a.question_id): a for a in attempt.answers}
+        question_map = {q.id: q for q in attempt.quiz.questions}
+        answer_map = {a.question_id: a for a in attempt.answers}
 
-        # Update answers with final selections and correctness
+        # Grade the final selections, then write them in one batched UPDATE
         score = 0
+        graded_answers: List[AttemptAnswer] = []
+        graded_rows: List[dict] = []
         for ans_data in answers:
-            if str(ans_data.question_id) in answer_map:
-                answer = answer_map[str(ans_data.question_id)]
-                answer.selected_answer = ans_data.selected_answer
+            answer = answer_map.get(ans_data.question_id)
+            if answer is None:
+                continue
+
+            question = question_map.get(ans_data.question_id)
+            if question and ans_data.selected_answer:
+                is_correct = ans_data.selected_answer == question.correct_answer
+                if is_correct:
+                    score += 1
+            else:
+                is_correct = False
+
+            graded_answers.append(answer)
+            graded_rows.append(
+                {
+                    "id": answer.id,
+                    "selected_answer": ans_data.selected_answer,
+                    "is_correct": is_correct,
+                }
+            )
 
-                question = question_map.get(str(ans_data.question_id))
-                if question and ans_data.selected_answer:
-                    is_correct = ans_data.selected_answer == question.correct_answer
-                    answer.is_correct = is_correct
-                    if is_correct:
-                        score += 1
-                else:
-                    answer.is_correct = False
+        if graded_rows:
+            # ORM bulk UPDATE by primary key; the loaded answers are brought in
+            # line without being marked dirty, so no per-row UPDATEs follow
+            await self.db.execute(update(AttemptAnswer), graded_rows)
+            for answer, row in zip(graded_answers, graded_rows):
+                set_committed_value(answer, "selected_answer", row["selected_answer"])
+                set_committed_value(answer, "is_correct", row["is_correct"])
 
         # Update attempt status
         attempt.status = AttemptStatus.COMPLETED
@@ -167,10 +197,11 @@ class AttemptService:
 
         # Build result response
         question_results = []
-        for question in sorted(attempt.quiz.questions, key=lambda q: q.order_index):
-            answer = answer_map.get(str(question.id))
+        # Quiz.questions is loaded in order_index order
+        for question in attempt.quiz.questions:
+            answer = answer_map.get(question.id)
             question_results.append(
-                QuestionResultResponse(
+                QuestionResultResponse.model_construct(
                     id=question.id,
                     question_text=question.question_text,
                     option_a=question.option_a,
@@ -184,7 +215,7 @@ class AttemptService:
                 )
             )
 
-        return AttemptResultResponse(
+        return AttemptResultResponse.model_construct(
             id=attempt.id,
             quiz_id=attempt.quiz_id,
             quiz_title=attempt.quiz.title,
@@ -204,6 +235,7 @@ class AttemptService:
             .options(
                 selectinload(QuizAttempt.answers),
                 selectinload(QuizAttempt.quiz).selectinload(Quiz.questions),
+                raiseload("*", sql_only=True),
             )
             .where(
                 and_(
@@ -217,13 +249,14 @@ class AttemptService:
         if not attempt:
             return None
 
-        answer_map = {str(a.question_id): a for a in attempt.answers}
+        answer_map = {a.question_id: a for a in attempt.answers}
 
         question_results = []
-        for question in sorted(attempt.quiz.questions, key=lambda q: q.order_index):
-            answer = answer_map.get(str(question.id))
+        # Quiz.questions is loaded in order_index order
+        for question in attempt.quiz.questions:
+            answer = answer_map.get(question.id)
             question_results.append(
-                QuestionResultResponse(
+                QuestionResultResponse.model_construct(
                     id=question.id,
                     question_text=question.question_text,
                     option_a=question.option_a,
@@ -237,7 +270,7 @@ class AttemptService:
                 )
             )
 
-        return AttemptResultResponse(
+        return AttemptResultResponse.model_construct(
             id=attempt.id,
             quiz_id=attempt.quiz_id,
             quiz_title=attempt.quiz.title,
@@ -250,28 +283,45 @@ class AttemptService:
         )
 
     async def get_user_attempts(self, user_id: UUID) -> UserAttemptsResponse:
-        from app.models.quiz import Quiz
-
+        # Question totals come from the maintained Quiz.question_count rather
+        # than loading or counting every question
         result = await self.db.execute(
-            select(QuizAttempt)
-            .options(selectinload(QuizAttempt.quiz).selectinload(Quiz.questions))
+            select(
+                QuizAttempt.id,
+                QuizAttempt.quiz_id,
+                Quiz.title,
+                QuizAttempt.status,
+                QuizAttempt.score,
+                Quiz.question_count,
+                QuizAttempt.started_at,
+                QuizAttempt.completed_at,
+            )
+            .join(Quiz, QuizAttempt.quiz_id == Quiz.id)
             .where(QuizAttempt.user_id == user_id)
             .order_by(QuizAttempt.started_at.desc())
         )
-        attempts = result.scalars().all()
 
         attempt_summaries = [
-            AttemptSummary(
-                id=a.id,
-                quiz_id=a.quiz_id,
-                quiz_title=a.quiz.title,
-                status=a.status,
-                score=a.score,
-                total_questions=len(a.quiz.questions),
-                started_at=a.started_at,
-                completed_at=a.completed_at,
+            AttemptSummary.model_construct(
+                id=attempt_id,
+                quiz_id=quiz_id,
+                quiz_title=quiz_title,
+                status=attempt_status,
+                score=score,
+                total_questions=total_questions,
+                started_at=started_at,
+                completed_at=completed_at,
             )
-            for a in attempts
+            for (
+                attempt_id,
+                quiz_id,
+                quiz_title,
+                attempt_status,
+                score,
+                total_questions,
+                started_at,
+                completed_at,
+            ) in result
         ]
 
         return UserAttemptsResponse(
@@ -2,13 +2,14 @@ from datetime import datetime
 from uuid import UUID
 from sqlalchemy import select, delete
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
 
 from app.models.user import User
 from app.models.token import RefreshToken
 from app.schemas.user import UserCreate, UserResponse, TokenResponse
 from app.utils.auth import (
-    hash_password,
-    verify_password,
+    hash_password_async,
+    verify_password_async,
     create_access_token,
     create_refresh_token,
     hash_token,
@@ -22,7 +23,9 @@ class AuthService:
     async def register(self, user_data: UserCreate) -> TokenResponse:
         # Check if user exists
         result = await self.db.execute(
-            select(User).where(User.email == user_data.email)
+            select(User)
+            .options(raiseload("*", sql_only=True))
+            .where(User.email == user_data.email)
         )
         existing_user = result.scalar_one_or_none()
         if existing_user:
@@ -31,13 +34,14 @@ class AuthService:
         # Create user
         user = User(
             email=user_data.email,
-            password_hash=hash_password(user_data.password),
+            password_hash=await hash_password_async(user_data.password),
             role=user_data.role,
             display_name=user_data.display_name,
         )
         self.db.add(user)
-        await self.db.commit()
-        await self.db.refresh(user)
+        # Flush assigns user.id and column defaults; the commit below covers
+        # the user and its refresh token in one transaction
+        await self.db.flush()
 
         # Generate tokens
         access_token = create_access_token(user.id, user.role.value)
@@ -55,14 +59,18 @@ class AuthService:
         return TokenResponse(
             access_token=access_token,
             refresh_token=refresh_token,
-            user=UserResponse.model_validate(user),
+            user=UserResponse.from_user(user),
         )
 
     async def login(self, email: str, password: str) -> TokenResponse:
-        result = await self.db.execute(select(User).where(User.email == email))
+        result = await self.db.execute(
+            select(User)
+            .options(raiseload("*", sql_only=True))
+            .where(User.email == email)
+        )
         user = result.scalar_one_or_none()
 
-        if not user or not verify_password(password, user.password_hash):
+        if not user or not await verify_password_async(password, user.password_hash):
             raise ValueError("Invalid email or password")
 
         # Generate tokens
@@ -81,28 +89,24 @@ class AuthService:
         return TokenResponse(
             access_token=access_token,
             refresh_token=refresh_token,
-            user=UserResponse.model_validate(user),
+            user=UserResponse.from_user(user),
         )
 
     async def refresh_access_token(self, refresh_token: str) -> dict:
         token_hash = hash_token(refresh_token)
 
+        # Token lookup and its user in one round trip
         result = await self.db.execute(
-            select(RefreshToken)
+            select(User)
+            .options(raiseload("*", sql_only=True))
+            .join(RefreshToken, RefreshToken.user_id == User.id)
             .where(RefreshToken.token_hash == token_hash)
             .where(RefreshToken.expires_at > datetime.utcnow())
         )
-        token_obj = result.scalar_one_or_none()
-
-        if not token_obj:
-            raise ValueError("Invalid or expired refresh token")
-
-        # Get user
-        result = await self.db.execute(select(User).where(User.id == token_obj.user_id))
         user = result.scalar_one_or_none()
 
         if not user:
-            raise ValueError("User not found")
+            raise ValueError("Invalid or expired refresh token")
 
         # Generate new access token
         access_token = create_access_token(user.id, user.role.value)
@@ -117,5 +121,9 @@ class AuthService:
         await self.db.commit()
 
     async def get_user_by_id(self, user_id: UUID) -> User | None:
-        result = await self.db.execute(select(User).where(User.id == user_id))
+        result = await self.db.execute(
+            select(User)
+            .options(raiseload("*", sql_only=True))
+            .where(User.id == user_id)
+        )
         return result.scalar_one_or_none()
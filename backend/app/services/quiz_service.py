@@ -1,24 +1,59 @@
+import base64
+import binascii
+from datetime import datetime
 from uuid import UUID
-from typing import Optional, List
-from sqlalchemy import select, func, delete, or_
+from typing import Optional, List, Tuple
+from sqlalchemy import select, func, delete, insert, update, or_, literal, case, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import raiseload, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
 from app.models.quiz import Quiz, Question, QuizTag, AnswerOption
-from app.models.attempt import QuizAttempt
 from app.schemas.quiz import (
+    QuestionCreate,
     QuizCreate,
     QuizUpdate,
+    QuizInstructorInfo,
     QuizListItem,
     QuizListResponse,
     SortOrder,
 )
 
 
+def _encode_cursor(created_at: datetime, quiz_id: UUID) -> str:
+    """Encode the last quiz of a page as an opaque keyset cursor."""
+    raw = f"{created_at.isoformat()}|{quiz_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def _decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """Decode a keyset cursor into (created_at, quiz_id)."""
+    try:
+        created_at, quiz_id = base64.urlsafe_b64decode(cursor).decode().split("|")
+        return datetime.fromisoformat(created_at), UUID(quiz_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise ValueError("Invalid cursor") from e
+
+
 class QuizService:
     def __init__(self, db: AsyncSession):
         self.db = db
 
+    @staticmethod
+    def _question_row(quiz_id: UUID, q_data: QuestionCreate, order_index: int) -> dict:
+        """Build an insert row for a question from validated question data."""
+        return {
+            "quiz_id": quiz_id,
+            "question_text": q_data.question_text,
+            "option_a": q_data.option_a,
+            "option_b": q_data.option_b,
+            "option_c": q_data.option_c,
+            "option_d": q_data.option_d,
+            "correct_answer": q_data.correct_answer,
+            "explanation": q_data.explanation,
+            "order_index": order_index,
+        }
+
     async def create_quiz(self, quiz_data: QuizCreate, instructor_id: UUID) -> Quiz:
         # Create quiz
         quiz = Quiz(
@@ -26,30 +61,26 @@ class QuizService:
             description=quiz_data.description,
             topic=quiz_data.topic,
             instructor_id=instructor_id,
+            question_count=len(quiz_data.questions),
         )
         self.db.add(quiz)
         await self.db.flush()
 
-        # Add tags
+        # Add tags in a single multi-row INSERT
         if quiz_data.tags:
-            for tag in quiz_data.tags:
-                quiz_tag = QuizTag(quiz_id=quiz.id, tag=tag)
-                self.db.add(quiz_tag)
-
-        # Add questions
-        for idx, q_data in enumerate(quiz_data.questions):
-            question = Question(
-                quiz_id=quiz.id,
-                question_text=q_data.question_text,
-                option_a=q_data.option_a,
-                option_b=q_data.option_b,
-                option_c=q_data.option_c,
-                option_d=q_data.option_d,
-                correct_answer=q_data.correct_answer,
-                explanation=q_data.explanation,
-                order_index=idx,
+            await self.db.execute(
+                insert(QuizTag),
+                [{"quiz_id": quiz.id, "tag": tag} for tag in quiz_data.tags],
             )
-            self.db.add(question)
+
+        # Add questions in a single multi-row INSERT
+        await self.db.execute(
+            insert(Question),
+            [
+                self._question_row(quiz.id, q_data, idx)
+                for idx, q_data in enumerate(quiz_data.questions)
+            ],
+        )
 
         await self.db.commit()
         await self.db.refresh(quiz)
@@ -64,11 +95,82 @@ class QuizService:
                 selectinload(Quiz.questions),
                 selectinload(Quiz.tags),
                 selectinload(Quiz.instructor),
+                raiseload("*", sql_only=True),
             )
             .where(Quiz.id == quiz_id)
         )
         return result.scalar_one_or_none()
 
+    async def get_quiz_owner_id(self, quiz_id: UUID) -> Optional[UUID]:
+        """Return a quiz's instructor id without loading its relationships."""
+        result = await self.db.execute(
+            select(Quiz.instructor_id).where(Quiz.id == quiz_id)
+        )
+        return result.scalar_one_or_none()
+
+    @staticmethod
+    def _title_match_rank(title: str):
+        """SQL expression ranking a quiz title match: 2 exact, 1 partial, 0 none."""
+        title_lower = title.lower()
+        quiz_title = func.lower(Quiz.title)
+        # Stored titles are the pattern on this side, so % and _ in them are
+        # escaped to keep them literal
+        escaped_title = func.replace(
+            func.replace(func.replace(quiz_title, "\\", "\\\\"), "%", "\\%"),
+            "_",
+            "\\_",
+        )
+        return case(
+            (quiz_title == title_lower, 2),
+            (
+                or_(
+                    quiz_title.contains(title_lower, autoescape=True),
+                    literal(title_lower).contains(escaped_title, escape="\\"),
+                ),
+                1,
+            ),
+            else_=0,
+        )
+
+    async def find_with_titles(
+        self, instructor_id: UUID, title: str, limit: int = 20
+    ) -> Tuple[Optional[Quiz], List[str]]:
+        """Find an instructor's quiz by title (case-insensitive, partial match).
+
+        Exact matches win over partial ones; ties go to the newest quiz.
+        Returns (quiz, titles); titles is only filled when nothing matches,
+        listing at most `limit` of the instructor's quizzes (newest first) to
+        offer as alternatives.
+        """
+        owned = (
+            Quiz.instructor_id == instructor_id,
+            Quiz.is_published.is_(True),
+        )
+        rank = self._title_match_rank(title)
+        result = await self.db.execute(
+            select(Quiz)
+            .options(
+                selectinload(Quiz.questions),
+                selectinload(Quiz.tags),
+                selectinload(Quiz.instructor),
+                raiseload("*", sql_only=True),
+            )
+            .where(*owned, rank > 0)
+            .order_by(rank.desc(), Quiz.created_at.desc())
+            .limit(1)
+        )
+        quiz = result.scalar_one_or_none()
+        if quiz is not None:
+            return quiz, []
+
+        result = await self.db.execute(
+            select(Quiz.title)
+            .where(*owned)
+            .order_by(Quiz.created_at.desc())
+            .limit(limit)
+        )
+        return None, list(result.scalars())
+
     async def list_quizzes(
         self,
         search: Optional[str] = None,
@@ -77,13 +179,22 @@ class QuizService:
         page: int = 1,
         page_size: int = 10,
         instructor_id: Optional[UUID] = None,
+        cursor: Optional[str] = None,
     ) -> QuizListResponse:
+        """List published quizzes with filters and sorting.
+
+        Newest-first listings also accept a keyset cursor (the next_cursor of
+        the previous page) in place of page, which avoids OFFSET scans.
+        """
+        if cursor and sort != SortOrder.NEWEST:
+            raise ValueError("Cursor pagination requires newest-first sorting")
+
         query = (
             select(Quiz)
             .options(
                 selectinload(Quiz.tags),
                 selectinload(Quiz.instructor),
-                selectinload(Quiz.questions),
+                raiseload("*", sql_only=True),
             )
             .where(Quiz.is_published.is_(True))
         )
@@ -109,48 +220,57 @@ class QuizService:
 
         # Sorting
         if sort == SortOrder.NEWEST:
-            query = query.order_by(Quiz.created_at.desc())
+            query = query.order_by(Quiz.created_at.desc(), Quiz.id.desc())
         elif sort == SortOrder.OLDEST:
             query = query.order_by(Quiz.created_at.asc())
         elif sort == SortOrder.ALPHABETICAL:
             query = query.order_by(Quiz.title.asc())
         elif sort == SortOrder.POPULAR:
-            # Sort by attempt count
-            subquery = (
-                select(
-                    QuizAttempt.quiz_id,
-                    func.count(QuizAttempt.id).label("attempt_count"),
-                )
-                .group_by(QuizAttempt.quiz_id)
-                .subquery()
-            )
-            query = query.outerjoin(subquery, Quiz.id == subquery.c.quiz_id).order_by(
-                func.coalesce(subquery.c.attempt_count, 0).desc()
-            )
+            query = query.order_by(Quiz.attempt_count.desc())
 
-        # Count total
+        # Count total over all filtered quizzes, before any cursor narrowing
         count_query = select(func.count()).select_from(query.subquery())
-        total_result = await self.db.execute(count_query)
-        total = total_result.scalar()
 
         # Pagination
-        offset = (page - 1) * page_size
-        query = query.offset(offset).limit(page_size)
+        if cursor:
+            created_at, quiz_id = _decode_cursor(cursor)
+            total = await self.db.scalar(count_query)
+            query = query.where(
+                tuple_(Quiz.created_at, Quiz.id) < tuple_(created_at, quiz_id)
+            ).limit(page_size)
+        else:
+            # Offset pages carry the total on every row as COUNT(*) OVER (),
+            # saving a second run of the filters and joins
+            total = None
+            offset = (page - 1) * page_size
+            query = (
+                query.add_columns(func.count().over())
+                .offset(offset)
+                .limit(page_size)
+            )
 
         result = await self.db.execute(query)
-        quizzes = result.scalars().all()
+        rows = result.all()
+        quizzes = [row[0] for row in rows]
+        if total is None:
+            # A page past the end has no rows to read the total from
+            total = rows[0][1] if rows else await self.db.scalar(count_query)
+
+        next_cursor = None
+        if sort == SortOrder.NEWEST and len(quizzes) == page_size:
+            next_cursor = _encode_cursor(quizzes[-1].created_at, quizzes[-1].id)
 
         quiz_items = [
-            QuizListItem(
+            QuizListItem.model_construct(
                 id=q.id,
                 title=q.title,
                 description=q.description,
                 topic=q.topic,
                 tags=[t.tag for t in q.tags],
-                instructor=q.instructor,
+                instructor=QuizInstructorInfo.from_user(q.instructor),
                 is_published=q.is_published,
                 created_at=q.created_at,
-                question_count=len(q.questions),
+                question_count=q.question_count,
             )
             for q in quizzes
         ]
@@ -160,6 +280,7 @@ class QuizService:
             total=total,
             page=page,
             page_size=page_size,
+            next_cursor=next_cursor,
         )
 
     async def get_instructor_quizzes(self, instructor_id: UUID) -> QuizListResponse:
@@ -168,7 +289,7 @@ class QuizService:
             .options(
                 selectinload(Quiz.tags),
                 selectinload(Quiz.instructor),
-                selectinload(Quiz.questions),
+                raiseload("*", sql_only=True),
             )
             .where(Quiz.instructor_id == instructor_id)
             .order_by(Quiz.created_at.desc())
@@ -178,16 +299,16 @@ class QuizService:
         quizzes = result.scalars().all()
 
         quiz_items = [
-            QuizListItem(
+            QuizListItem.model_construct(
                 id=q.id,
                 title=q.title,
                 description=q.description,
                 topic=q.topic,
                 tags=[t.tag for t in q.tags],
-                instructor=q.instructor,
+                instructor=QuizInstructorInfo.from_user(q.instructor),
                 is_published=q.is_published,
                 created_at=q.created_at,
-                question_count=len(q.questions),
+                question_count=q.question_count,
             )
             for q in quizzes
         ]
@@ -199,12 +320,28 @@ class QuizService:
             page_size=len(quiz_items),
         )
 
+    async def _get_owned_quiz(
+        self, quiz_id: UUID, instructor_id: UUID
+    ) -> Optional[Quiz]:
+        """Return the bare quiz row if the instructor owns it.
+
+        Uses the identity map when the quiz is already loaded in this session,
+        and otherwise loads just the quiz row without its relationships.
+        """
+        quiz = await self.db.get(Quiz, quiz_id)
+        if not quiz or quiz.instructor_id != instructor_id:
+            return None
+        return quiz
+
+    async def _check_owner(self, quiz_id: UUID, instructor_id: UUID) -> bool:
+        return await self._get_owned_quiz(quiz_id, instructor_id) is not None
+
     async def update_quiz(
         self, quiz_id: UUID, update_data: QuizUpdate, instructor_id: UUID
     ) -> Optional[Quiz]:
-        quiz = await self.get_quiz_by_id(quiz_id)
+        quiz = await self._get_owned_quiz(quiz_id, instructor_id)
 
-        if not quiz or quiz.instructor_id != instructor_id:
+        if not quiz:
             return None
 
         if update_data.title is not None:
@@ -219,41 +356,37 @@ class QuizService:
         if update_data.tags is not None:
             # Delete existing tags
             await self.db.execute(delete(QuizTag).where(QuizTag.quiz_id == quiz_id))
-            # Add new tags
-            for tag in update_data.tags:
-                quiz_tag = QuizTag(quiz_id=quiz_id, tag=tag)
-                self.db.add(quiz_tag)
+            # Add new tags in a single multi-row INSERT
+            if update_data.tags:
+                await self.db.execute(
+                    insert(QuizTag),
+                    [{"quiz_id": quiz_id, "tag": tag} for tag in update_data.tags],
+                )
 
         if update_data.questions is not None:
             # Delete existing questions
             await self.db.execute(delete(Question).where(Question.quiz_id == quiz_id))
-            # Add new questions
-            for idx, q_data in enumerate(update_data.questions):
-                question = Question(
-                    quiz_id=quiz_id,
-                    question_text=q_data.question_text,
-                    option_a=q_data.option_a,
-                    option_b=q_data.option_b,
-                    option_c=q_data.option_c,
-                    option_d=q_data.option_d,
-                    correct_answer=q_data.correct_answer,
-                    explanation=q_data.explanation,
-                    order_index=idx,
+            quiz.question_count = len(update_data.questions)
+            # Add new questions in a single multi-row INSERT
+            if update_data.questions:
+                await self.db.execute(
+                    insert(Question),
+                    [
+                        self._question_row(quiz_id, q_data, idx)
+                        for idx, q_data in enumerate(update_data.questions)
+                    ],
                 )
-                self.db.add(question)
 
         await self.db.commit()
         return await self.get_quiz_by_id(quiz_id)
 
     async def delete_quiz(self, quiz_id: UUID, instructor_id: UUID) -> bool:
-        quiz = await self.get_quiz_by_id(quiz_id)
-
-        if not quiz or quiz.instructor_id != instructor_id:
-            return False
-
-        await self.db.delete(quiz)
+        # Questions, tags, attempts and answers go via ON DELETE CASCADE
+        result = await self.db.execute(
+            delete(Quiz).where(Quiz.id == quiz_id, Quiz.instructor_id == instructor_id)
+        )
         await self.db.commit()
-        return True
+        return result.rowcount > 0
 
     async def update_question(
         self,
@@ -269,18 +402,21 @@ class QuizService:
         explanation: Optional[str] = None,
     ) -> Optional[Question]:
         """Update a specific question within a quiz by question number (1-5)."""
-        quiz = await self.get_quiz_by_id(quiz_id)
-
-        if not quiz or quiz.instructor_id != instructor_id:
+        if question_number < 1 or not await self._check_owner(quiz_id, instructor_id):
             return None
 
-        # Sort questions by order_index and get the one at question_number - 1
-        sorted_questions = sorted(quiz.questions, key=lambda q: q.order_index)
-        if question_number < 1 or question_number > len(sorted_questions):
+        # Fetch only the question at position question_number in order_index order
+        question = await self.db.scalar(
+            select(Question)
+            .options(raiseload("*", sql_only=True))
+            .where(Question.quiz_id == quiz_id)
+            .order_by(Question.order_index)
+            .offset(question_number - 1)
+            .limit(1)
+        )
+        if not question:
             return None
 
-        question = sorted_questions[question_number - 1]
-
         # Update fields if provided
         if question_text is not None:
             question.question_text = question_text
@@ -308,34 +444,47 @@ class QuizService:
         questions_data: List[dict],
     ) -> Optional[List[Question]]:
         """Add new questions to an existing quiz."""
-        quiz = await self.get_quiz_by_id(quiz_id)
-
-        if not quiz or quiz.instructor_id != instructor_id:
+        quiz = await self._get_owned_quiz(quiz_id, instructor_id)
+        if not quiz:
             return None
 
+        if not questions_data:
+            return []
+
         # Get the current highest order_index
-        current_max_index = max((q.order_index for q in quiz.questions), default=-1)
-
-        new_questions = []
-        for idx, q_data in enumerate(questions_data):
-            question = Question(
-                quiz_id=quiz_id,
-                question_text=q_data["question_text"],
-                option_a=q_data["option_a"],
-                option_b=q_data["option_b"],
-                option_c=q_data["option_c"],
-                option_d=q_data["option_d"],
-                correct_answer=AnswerOption(q_data["correct_answer"]),
-                explanation=q_data.get("explanation"),
-                order_index=current_max_index + 1 + idx,
+        current_max_index = await self.db.scalar(
+            select(func.coalesce(func.max(Question.order_index), -1)).where(
+                Question.quiz_id == quiz_id
             )
-            self.db.add(question)
-            new_questions.append(question)
+        )
 
-        await self.db.commit()
+        # Insert all new questions in one statement, returning the ORM rows
+        result = await self.db.scalars(
+            insert(Question).returning(Question),
+            [
+                self._question_row(
+                    quiz_id,
+                    QuestionCreate.model_validate(q_data),
+                    current_max_index + 1 + idx,
+                )
+                for idx, q_data in enumerate(questions_data)
+            ],
+        )
+        new_questions = list(result.all())
 
-        # Refresh all new questions
-        for q in new_questions:
-            await self.db.refresh(q)
+        # Increment in SQL so concurrent adds to one quiz cannot lose an update;
+        # adding questions is not treated as an edit of the quiz itself
+        question_count = await self.db.scalar(
+            update(Quiz)
+            .where(Quiz.id == quiz_id)
+            .values(
+                question_count=Quiz.question_count + len(new_questions),
+                updated_at=Quiz.updated_at,
+            )
+            .returning(Quiz.question_count)
+            .execution_options(synchronize_session=False)
+        )
+        set_committed_value(quiz, "question_count", question_count)
 
+        await self.db.commit()
         return new_questions
@@ -1,13 +1,56 @@
+import asyncio
 import httpx
-from typing import Optional
+import time
+from typing import Any, Dict, Optional, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Article text changes rarely, so extracts are kept for a day per topic
+EXTRACT_CACHE_TTL_SECONDS = 24 * 60 * 60.0
+EXTRACT_CACHE_MAX_SIZE = 256
+
+ExtractKey = Tuple[str, int]
+
+# (normalized topic, max_chars) -> (expires_at, extract)
+_extract_cache: Dict[ExtractKey, Tuple[float, str]] = {}
+
+# Lookups in flight, so concurrent misses for one topic share a single fetch
+_pending_extracts: Dict[ExtractKey, "asyncio.Task[Optional[str]]"] = {}
+
+
+def _cache_extract(key: ExtractKey, content: str) -> None:
+    """Store an extract, pruning expired entries when the cache is full."""
+    now = time.monotonic()
+    if len(_extract_cache) >= EXTRACT_CACHE_MAX_SIZE:
+        expired = [
+            k for k, (expires_at, _) in _extract_cache.items() if expires_at <= now
+        ]
+        for k in expired:
+            del _extract_cache[k]
+        if len(_extract_cache) >= EXTRACT_CACHE_MAX_SIZE:
+            _extract_cache.clear()
+    _extract_cache[key] = (now + EXTRACT_CACHE_TTL_SECONDS, content)
+
+
+def create_wikipedia_client() -> httpx.AsyncClient:
+    """Build an HTTP client for the Wikipedia API with pooled keep-alive connections."""
+    return httpx.AsyncClient(
+        timeout=10.0,
+        headers={
+            "User-Agent": "QuizBuilder/1.0 (Educational Quiz Application; contact@example.com)"
+        },
+        limits=httpx.Limits(max_keepalive_connections=10, max_connections=20),
+    )
+
 
 class WikipediaService:
     BASE_URL = "https://en.wikipedia.org/w/api.php"
 
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
+        # Shared app-wide client; without one each lookup opens its own
+        self._client = client
+
     async def search_and_extract(
         self, topic: str, max_chars: int = 8000
     ) -> Optional[str]:
@@ -15,77 +58,76 @@ class WikipediaService:
         Search Wikipedia for a topic and extract relevant content for RAG.
         Returns None if Wikipedia is unavailable or topic not found.
         """
+        key = (topic.strip().lower(), max_chars)
+        entry = _extract_cache.get(key)
+        if entry is not None:
+            expires_at, content = entry
+            if time.monotonic() < expires_at:
+                return content
+            del _extract_cache[key]
+
+        task = _pending_extracts.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._lookup(key, topic, max_chars))
+            _pending_extracts[key] = task
+            task.add_done_callback(lambda _: _pending_extracts.pop(key, None))
+        # A caller giving up (e.g. on timeout) leaves the fetch running for the
+        # others and for the cache
+        return await asyncio.shield(task)
+
+    async def _lookup(
+        self, key: ExtractKey, topic: str, max_chars: int
+    ) -> Optional[str]:
+        """Fetch an extract and cache it; None (unavailable or not found) is not."""
+        content = await self._fetch_extract(topic, max_chars)
+        if content is not None:
+            _cache_extract(key, content)
+        return content
+
+    async def _fetch_extract(self, topic: str, max_chars: int) -> Optional[str]:
+        """Fetch the plain-text extract of the top search hit for a topic."""
         try:
-            headers = {
-                "User-Agent": "QuizBuilder/1.0 (Educational Quiz Application; contact@example.com)"
+            # Search and extract in one request: the search generator feeds
+            # its top hit straight into prop=extracts
+            params = {
+                "action": "query",
+                "generator": "search",
+                "gsrsearch": topic,
+                "gsrlimit": 1,
+                "prop": "extracts",
+                "explaintext": True,
+                "format": "json",
+                "exlimit": 1,
             }
-            async with httpx.AsyncClient(timeout=10.0, headers=headers) as client:
-                # First, search for the topic
-                search_params = {
-                    "action": "query",
-                    "list": "search",
-                    "srsearch": topic,
-                    "format": "json",
-                    "srlimit": 3,
-                }
-
-                search_response = await client.get(self.BASE_URL, params=search_params)
-
-                if search_response.status_code != 200:
-                    logger.warning(
-                        f"Wikipedia search failed with status {search_response.status_code}"
-                    )
-                    return None
-
-                if not search_response.content:
-                    logger.warning("Wikipedia returned empty response")
-                    return None
-
-                search_data = search_response.json()
-
-                if not search_data.get("query", {}).get("search"):
-                    logger.info(f"No Wikipedia results found for: {topic}")
-                    return None
-
-                # Get the top result's page ID
-                top_result = search_data["query"]["search"][0]
-                page_title = top_result["title"]
-
-                # Extract the page content
-                extract_params = {
-                    "action": "query",
-                    "titles": page_title,
-                    "prop": "extracts",
-                    "explaintext": True,
-                    "format": "json",
-                    "exlimit": 1,
-                }
-
-                extract_response = await client.get(
-                    self.BASE_URL, params=extract_params
+
+            response = await self._get(params)
+
+            if response.status_code != 200:
+                logger.warning(
+                    f"Wikipedia query failed with status {response.status_code}"
                 )
+                return None
 
-                if extract_response.status_code != 200:
-                    logger.warning(
-                        f"Wikipedia extract failed with status {extract_response.status_code}"
-                    )
-                    return None
+            if not response.content:
+                logger.warning("Wikipedia returned empty response")
+                return None
 
-                extract_data = extract_response.json()
+            data = response.json()
 
-                pages = extract_data.get("query", {}).get("pages", {})
-                if not pages:
-                    return None
+            pages = data.get("query", {}).get("pages", {})
+            if not pages:
+                logger.info(f"No Wikipedia results found for: {topic}")
+                return None
 
-                # Get the first page's extract
-                page = list(pages.values())[0]
-                content = page.get("extract", "")
+            # Get the first page's extract
+            page = list(pages.values())[0]
+            content = page.get("extract", "")
 
-                # Truncate to max_chars
-                if len(content) > max_chars:
-                    content = content[:max_chars] + "..."
+            # Truncate to max_chars
+            if len(content) > max_chars:
+                content = content[:max_chars] + "..."
 
-                return content
+            return content
 
         except httpx.TimeoutException:
             logger.warning(f"Wikipedia request timed out for: {topic}")
@@ -96,3 +138,10 @@ class WikipediaService:
         except Exception as e:
             logger.error(f"Wikipedia service error: {e}")
             return None
+
+    async def _get(self, params: Dict[str, Any]) -> httpx.Response:
+        """GET the API with the shared client, or a one-off client if none."""
+        if self._client is not None:
+            return await self._client.get(self.BASE_URL, params=params)
+        async with create_wikipedia_client() as client:
+            return await client.get(self.BASE_URL, params=params)
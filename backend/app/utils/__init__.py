@@ -1,17 +1,25 @@
 from app.utils.auth import (
     hash_password,
+    hash_password_async,
     verify_password,
+    verify_password_async,
     create_access_token,
     create_refresh_token,
     verify_token,
 )
+from app.utils.ids import uuid7
+from app.utils.responses import model_json_response
 from app.utils.sanitize import sanitize_input
 
 __all__ = [
     "hash_password",
+    "hash_password_async",
     "verify_password",
+    "verify_password_async",
     "create_access_token",
     "create_refresh_token",
     "verify_token",
     "sanitize_input",
+    "uuid7",
+    "model_json_response",
 ]
@@ -1,3 +1,4 @@
+import asyncio
 import bcrypt
 import jwt
 from datetime import datetime, timedelta
@@ -9,9 +10,13 @@ from app.config import get_settings
 
 settings = get_settings()
 
+# HMAC key and accepted algorithms, prepared once instead of on every token
+_JWT_KEY = settings.jwt_secret_key.encode("utf-8")
+_JWT_ALGORITHMS = [settings.jwt_algorithm]
+
 
 def hash_password(password: str) -> str:
-    salt = bcrypt.gensalt()
+    salt = bcrypt.gensalt(rounds=settings.bcrypt_rounds)
     return bcrypt.hashpw(password.encode("utf-8"), salt).decode("utf-8")
 
 
@@ -19,6 +24,16 @@ def verify_password(password: str, hashed: str) -> bool:
     return bcrypt.checkpw(password.encode("utf-8"), hashed.encode("utf-8"))
 
 
+async def hash_password_async(password: str) -> str:
+    """hash_password in a worker thread; bcrypt releases the GIL while hashing."""
+    return await asyncio.to_thread(hash_password, password)
+
+
+async def verify_password_async(password: str, hashed: str) -> bool:
+    """verify_password in a worker thread, keeping the event loop free."""
+    return await asyncio.to_thread(verify_password, password, hashed)
+
+
 def create_access_token(user_id: UUID, role: str) -> str:
     expire = datetime.utcnow() + timedelta(minutes=settings.access_token_expire_minutes)
     payload = {
@@ -27,9 +42,7 @@ def create_access_token(user_id: UUID, role: str) -> str:
         "exp": expire,
         "type": "access",
     }
-    return jwt.encode(
-        payload, settings.jwt_secret_key, algorithm=settings.jwt_algorithm
-    )
+    return jwt.encode(payload, _JWT_KEY, algorithm=settings.jwt_algorithm)
 
 
 def create_refresh_token(user_id: UUID) -> tuple[str, str, datetime]:
@@ -40,20 +53,14 @@ def create_refresh_token(user_id: UUID) -> tuple[str, str, datetime]:
         "exp": expire,
         "type": "refresh",
     }
-    token = jwt.encode(
-        payload, settings.jwt_secret_key, algorithm=settings.jwt_algorithm
-    )
+    token = jwt.encode(payload, _JWT_KEY, algorithm=settings.jwt_algorithm)
     token_hash = hashlib.sha256(token.encode()).hexdigest()
     return token, token_hash, expire
 
 
 def verify_token(token: str, token_type: str = "access") -> Optional[dict]:
     try:
-        payload = jwt.decode(
-            token,
-            settings.jwt_secret_key,
-            algorithms=[settings.jwt_algorithm],
-        )
+        payload = jwt.decode(token, _JWT_KEY, algorithms=_JWT_ALGORITHMS)
         if payload.get("type") != token_type:
             return None
         return payload
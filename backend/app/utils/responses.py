@@ -0,0 +1,18 @@
+from fastapi import Response
+from pydantic import BaseModel
+
+
+def model_json_response(model: BaseModel, status_code: int = 200) -> Response:
+    """
+    Serialize an already-built response model in one pydantic-core pass.
+
+    Returning a Response bypasses FastAPI's response handling, which would
+    dump the model to a dict, re-validate it against response_model (or walk
+    it with jsonable_encoder when there is none) and encode it again. Keep
+    response_model on the route so the OpenAPI schema is unchanged.
+    """
+    return Response(
+        content=model.model_dump_json(),
+        media_type="application/json",
+        status_code=status_code,
+    )
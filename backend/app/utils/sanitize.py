@@ -1,5 +1,64 @@
 import re
 from html import escape
+from typing import Tuple
+
+# Common prompt injection patterns
+_INJECTION_PATTERNS = (
+    r"ignore\s+(previous|above|all)\s+instructions?",
+    r"disregard\s+(previous|above|all)\s+instructions?",
+    r"forget\s+(previous|above|all)\s+instructions?",
+    r"new\s+instructions?:",
+    r"system\s*:",
+    r"assistant\s*:",
+    r"\[system\]",
+    r"\[assistant\]",
+    r"<\|.*?\|>",
+    r"```system",
+)
+
+# Role-play patterns filtered additionally from AI prompts
+_AI_PATTERNS = (
+    r"you\s+are\s+(now|actually)",
+    r"pretend\s+(to\s+be|you\s+are)",
+    r"roleplay\s+as",
+    r"act\s+as\s+if",
+    r"your\s+(new\s+)?role\s+is",
+)
+
+
+# Every pattern above contains one of these literals (lowercase), so text
+# without any of them cannot match and skips the regex scan
+_INJECTION_TRIGGERS = (
+    "ignore",
+    "disregard",
+    "forget",
+    "new",
+    "system",
+    "assistant",
+    "<|",
+)
+_AI_TRIGGERS = ("you", "pretend", "roleplay", "act")
+
+
+def _may_match(text: str, triggers: Tuple[str, ...]) -> bool:
+    """Cheap prefilter: False only when text cannot match the guarded patterns.
+
+    Non-ASCII text always goes to the regex, since re.IGNORECASE folds some
+    non-ASCII letters onto ASCII ones (e.g. "\u017f" matches "s").
+    """
+    if not text.isascii():
+        return True
+    lowered = text.lower()
+    return any(trigger in lowered for trigger in triggers)
+
+
+def _combine(patterns: Tuple[str, ...]) -> re.Pattern:
+    """Compile patterns into one case-insensitive alternation, scanned in one pass."""
+    return re.compile("|".join(f"(?:{p})" for p in patterns), re.IGNORECASE)
+
+
+_INJECTION_RE = _combine(_INJECTION_PATTERNS)
+_AI_RE = _combine(_AI_PATTERNS)
 
 
 def sanitize_input(text: str) -> str:
@@ -13,21 +72,8 @@ def sanitize_input(text: str) -> str:
     text = escape(text)
 
     # Remove common prompt injection patterns
-    injection_patterns = [
-        r"ignore\s+(previous|above|all)\s+instructions?",
-        r"disregard\s+(previous|above|all)\s+instructions?",
-        r"forget\s+(previous|above|all)\s+instructions?",
-        r"new\s+instructions?:",
-        r"system\s*:",
-        r"assistant\s*:",
-        r"\[system\]",
-        r"\[assistant\]",
-        r"<\|.*?\|>",
-        r"```system",
-    ]
-
-    for pattern in injection_patterns:
-        text = re.sub(pattern, "[FILTERED]", text, flags=re.IGNORECASE)
+    if _may_match(text, _INJECTION_TRIGGERS):
+        text = _INJECTION_RE.sub("[FILTERED]", text)
 
     return text.strip()
 
@@ -40,15 +86,7 @@ def sanitize_for_ai(text: str) -> str:
     text = sanitize_input(text)
 
     # Additional AI-specific sanitization
-    ai_patterns = [
-        r"you\s+are\s+(now|actually)",
-        r"pretend\s+(to\s+be|you\s+are)",
-        r"roleplay\s+as",
-        r"act\s+as\s+if",
-        r"your\s+(new\s+)?role\s+is",
-    ]
-
-    for pattern in ai_patterns:
-        text = re.sub(pattern, "[FILTERED]", text, flags=re.IGNORECASE)
+    if _may_match(text, _AI_TRIGGERS):
+        text = _AI_RE.sub("[FILTERED]", text)
 
     return text
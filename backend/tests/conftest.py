@@ -5,6 +5,7 @@ from datetime import datetime
 from uuid import uuid4
 from typing import AsyncGenerator, Dict, Any
 
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.dialects.sqlite.base import SQLiteTypeCompiler
 from sqlalchemy.pool import StaticPool
@@ -39,6 +40,11 @@ async def async_engine():
         echo=False,
     )
 
+    # Enforce foreign keys (and ON DELETE CASCADE) like PostgreSQL does
+    @event.listens_for(engine.sync_engine, "connect")
+    def enable_foreign_keys(dbapi_connection, connection_record):
+        dbapi_connection.execute("PRAGMA foreign_keys=ON")
+
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
@@ -245,6 +251,7 @@ async def sample_quiz(
         topic="General Knowledge",
         instructor_id=test_instructor.id,
         is_published=True,
+        question_count=len(sample_question_data),
         created_at=datetime.utcnow(),
         updated_at=datetime.utcnow(),
     )
@@ -135,6 +135,21 @@ class TestSaveProgressEndpoint:
 
         assert response.status_code == 404
 
+    async def test_save_progress_invalid_answer(
+        self,
+        test_client: AsyncClient,
+        sample_attempt: QuizAttempt,
+        student_auth_headers: dict,
+    ):
+        """Test saving progress with a malformed answer is rejected."""
+        response = await test_client.put(
+            f"/api/attempts/{sample_attempt.id}",
+            json={"answers": [{"question_id": "not-a-uuid", "selected_answer": "E"}]},
+            headers=student_auth_headers,
+        )
+
+        assert response.status_code == 422
+
 
 class TestSubmitAttemptEndpoint:
     """Tests for POST /api/attempts/{attempt_id}/submit."""
@@ -249,3 +249,28 @@ class TestMeEndpoint:
         )
 
         assert response.status_code == 401
+
+    async def test_me_reflects_profile_update(
+        self,
+        test_client: AsyncClient,
+        test_instructor: User,
+        instructor_auth_headers: dict,
+    ):
+        """Test a cached user is refreshed after a profile update."""
+        first = await test_client.get("/api/auth/me", headers=instructor_auth_headers)
+        assert first.json()["display_name"] == "Test Instructor"
+
+        update = await test_client.put(
+            "/api/users/me",
+            headers=instructor_auth_headers,
+            json={"display_name": "Renamed Instructor"},
+        )
+        assert update.status_code == 200
+
+        response = await test_client.get(
+            "/api/auth/me",
+            headers=instructor_auth_headers,
+        )
+
+        assert response.status_code == 200
+        assert response.json()["display_name"] == "Renamed Instructor"
@@ -1,8 +1,10 @@
 """Integration tests for AI chat routes."""
 
 import pytest
+import json
 from unittest.mock import AsyncMock, MagicMock, patch
 from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from app.models.user import User
 from app.models.quiz import Quiz
@@ -30,6 +32,37 @@ def create_mock_openai_response(content: str, tool_calls=None):
     return mock_response
 
 
+def create_mock_stream_chunk(content=None, tool_calls=None, finish_reason=None):
+    """Create a mock streamed completion chunk."""
+    mock_choice = MagicMock()
+    mock_choice.delta.content = content
+    mock_choice.delta.tool_calls = tool_calls
+    mock_choice.finish_reason = finish_reason
+
+    mock_chunk = MagicMock()
+    mock_chunk.choices = [mock_choice]
+    return mock_chunk
+
+
+def create_mock_stream(chunks):
+    """Create a mock async iterator over streamed chunks."""
+
+    async def stream():
+        for chunk in chunks:
+            yield chunk
+
+    return stream()
+
+
+def parse_sse_events(body: str):
+    """Parse the data payloads of a server-sent event stream."""
+    return [
+        json.loads(line[len("data: ") :])
+        for line in body.splitlines()
+        if line.startswith("data: ")
+    ]
+
+
 class TestChatEndpoint:
     """Tests for POST /api/chat."""
 
@@ -59,6 +92,11 @@ class TestChatEndpoint:
         data = response.json()
         assert "response" in data
         assert data["action_taken"] is None
+        request_body = mock_client.chat.completions.create.call_args.kwargs[
+            "extra_body"
+        ]
+        assert request_body["prompt_cache_key"] == "kqb:Cosmo the Cougar"
+        assert request_body["tool_choice"] == "auto"
 
     async def test_chat_with_conversation_history(
         self,
@@ -181,6 +219,75 @@ class TestChatEndpoint:
         assert "response" in data
         assert data["action_taken"] == "list_quizzes"
 
+    async def test_chat_with_multiple_tool_calls(
+        self,
+        test_client: AsyncClient,
+        sample_quiz: Quiz,
+        instructor_auth_headers: dict,
+    ):
+        """Test several tool calls in one turn reply in the requested order."""
+        tool_calls = []
+        for call_id, name, arguments in [
+            ("call_details", "get_quiz_details", '{"quiz_title": "Sample"}'),
+            ("call_list", "list_quizzes", "{}"),
+        ]:
+            mock_tool_call = MagicMock()
+            mock_tool_call.id = call_id
+            mock_tool_call.function.name = name
+            mock_tool_call.function.arguments = arguments
+            tool_calls.append(mock_tool_call)
+
+        mock_response_with_tools = create_mock_openai_response(None, tool_calls)
+        mock_final_response = create_mock_openai_response("Done.")
+
+        with patch("app.services.ai_service.AsyncOpenAI") as mock_openai_class:
+            mock_client = AsyncMock()
+            mock_client.chat.completions.create = AsyncMock(
+                side_effect=[mock_response_with_tools, mock_final_response]
+            )
+            mock_openai_class.return_value = mock_client
+
+            response = await test_client.post(
+                "/api/chat",
+                json={"message": "Show me Sample and list my quizzes"},
+                headers=instructor_auth_headers,
+            )
+
+            second_call_messages = mock_client.chat.completions.create.call_args_list[
+                1
+            ].kwargs["messages"]
+
+        assert response.status_code == 200
+        assert response.json()["action_taken"] == "list_quizzes"
+        tool_messages = [m for m in second_call_messages if m["role"] == "tool"]
+        assert [m["tool_call_id"] for m in tool_messages] == [
+            "call_details",
+            "call_list",
+        ]
+        assert sample_quiz.title in tool_messages[0]["content"]
+
+    async def test_chat_error_hides_details(
+        self,
+        test_client: AsyncClient,
+        instructor_auth_headers: dict,
+    ):
+        """Test upstream error text is not returned to the client."""
+        with patch("app.services.ai_service.AsyncOpenAI") as mock_openai_class:
+            mock_client = AsyncMock()
+            mock_client.chat.completions.create = AsyncMock(
+                side_effect=RuntimeError("Incorrect API key provided: sk-secret")
+            )
+            mock_openai_class.return_value = mock_client
+
+            response = await test_client.post(
+                "/api/chat",
+                json={"message": "Hello"},
+                headers=instructor_auth_headers,
+            )
+
+        assert response.status_code == 500
+        assert response.json()["detail"] == "AI service error"
+
     async def test_chat_empty_message(
         self,
         test_client: AsyncClient,
@@ -206,6 +313,229 @@ class TestChatEndpoint:
         assert response.status_code == 200
 
 
+class RecordingSession(AsyncSession):
+    """AsyncSession that remembers whether it has been closed."""
+
+    closed = False
+
+    async def close(self) -> None:
+        self.closed = True
+        await super().close()
+
+
+@pytest.fixture
+def stream_sessions(async_engine, monkeypatch) -> list:
+    """Sessions opened by the streaming route, bound to the test database."""
+    sessions = []
+    session_maker = async_sessionmaker(
+        async_engine,
+        class_=RecordingSession,
+        expire_on_commit=False,
+        autoflush=False,
+    )
+
+    def open_session() -> RecordingSession:
+        session = session_maker()
+        sessions.append(session)
+        return session
+
+    monkeypatch.setattr("app.routers.chat.AsyncSessionLocal", open_session)
+    return sessions
+
+
+@pytest.mark.usefixtures("stream_sessions")
+class TestChatStreamEndpoint:
+    """Tests for POST /api/chat/stream."""
+
+    async def test_chat_stream_tokens(
+        self,
+        test_client: AsyncClient,
+        instructor_auth_headers: dict,
+    ):
+        """Test that text fragments are streamed as token events."""
+        chunks = [
+            create_mock_stream_chunk(content="Hello"),
+            create_mock_stream_chunk(content=" there!"),
+            create_mock_stream_chunk(finish_reason="stop"),
+        ]
+
+        with patch("app.services.ai_service.AsyncOpenAI") as mock_openai_class:
+            mock_client = AsyncMock()
+            mock_client.chat.completions.create = AsyncMock(
+                return_value=create_mock_stream(chunks)
+            )
+            mock_openai_class.return_value = mock_client
+
+            response = await test_client.post(
+                "/api/chat/stream",
+                json={"message": "Hello!"},
+                headers=instructor_auth_headers,
+            )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        events = parse_sse_events(response.text)
+        assert [e["content"] for e in events if e["type"] == "token"] == [
+            "Hello",
+            " there!",
+        ]
+        assert events[-1] == {"type": "done", "action_taken": None, "data": None}
+
+    async def test_chat_stream_with_tool_call(
+        self,
+        test_client: AsyncClient,
+        sample_quiz: Quiz,
+        instructor_auth_headers: dict,
+    ):
+        """Test that fragmented tool calls are assembled and executed."""
+        first_fragment = MagicMock()
+        first_fragment.index = 0
+        first_fragment.id = "call_test123"
+        first_fragment.function.name = "list_quizzes"
+        first_fragment.function.arguments = '{"li'
+        second_fragment = MagicMock()
+        second_fragment.index = 0
+        second_fragment.id = None
+        second_fragment.function.name = None
+        second_fragment.function.arguments = 'mit": 5}'
+
+        tool_chunks = [
+            create_mock_stream_chunk(tool_calls=[first_fragment]),
+            create_mock_stream_chunk(tool_calls=[second_fragment]),
+            create_mock_stream_chunk(finish_reason="tool_calls"),
+        ]
+        final_chunks = [
+            create_mock_stream_chunk(content="Here are your quizzes."),
+            create_mock_stream_chunk(finish_reason="stop"),
+        ]
+
+        with patch("app.services.ai_service.AsyncOpenAI") as mock_openai_class:
+            mock_client = AsyncMock()
+            mock_client.chat.completions.create = AsyncMock(
+                side_effect=[
+                    create_mock_stream(tool_chunks),
+                    create_mock_stream(final_chunks),
+                ]
+            )
+            mock_openai_class.return_value = mock_client
+
+            response = await test_client.post(
+                "/api/chat/stream",
+                json={"message": "List my quizzes"},
+                headers=instructor_auth_headers,
+            )
+
+            second_call_messages = mock_client.chat.completions.create.call_args_list[
+                1
+            ].kwargs["messages"]
+
+        assert response.status_code == 200
+        events = parse_sse_events(response.text)
+        assert {"type": "action", "action_taken": "list_quizzes"} in events
+        assert events[-1]["type"] == "done"
+        assert events[-1]["action_taken"] == "list_quizzes"
+        assert events[-1]["data"]["total"] == 1
+
+        assistant_turn = second_call_messages[-2]
+        assert assistant_turn["tool_calls"][0]["function"] == {
+            "name": "list_quizzes",
+            "arguments": '{"limit": 5}',
+        }
+        assert second_call_messages[-1]["tool_call_id"] == "call_test123"
+
+    async def test_chat_stream_tools_use_own_session(
+        self,
+        test_client: AsyncClient,
+        db_session: AsyncSession,
+        sample_quiz: Quiz,
+        instructor_auth_headers: dict,
+        stream_sessions: list,
+        monkeypatch,
+    ):
+        """Test tools run on a session owned by the stream, not the request's."""
+        streaming = False
+
+        def request_session_closed(*args, **kwargs):
+            raise AssertionError("Request session used after the response started")
+
+        for method in ("execute", "scalar", "scalars", "get", "commit"):
+            original = getattr(db_session, method)
+            monkeypatch.setattr(
+                db_session,
+                method,
+                lambda *a, _original=original, **kw: (
+                    request_session_closed() if streaming else _original(*a, **kw)
+                ),
+            )
+
+        mock_tool_call = MagicMock()
+        mock_tool_call.index = 0
+        mock_tool_call.id = "call_list"
+        mock_tool_call.function.name = "list_quizzes"
+        mock_tool_call.function.arguments = "{}"
+        streams = [
+            create_mock_stream(
+                [
+                    create_mock_stream_chunk(tool_calls=[mock_tool_call]),
+                    create_mock_stream_chunk(finish_reason="tool_calls"),
+                ]
+            ),
+            create_mock_stream(
+                [
+                    create_mock_stream_chunk(content="Here they are."),
+                    create_mock_stream_chunk(finish_reason="stop"),
+                ]
+            ),
+        ]
+
+        async def create(**kwargs):
+            nonlocal streaming
+            streaming = True
+            return streams.pop(0)
+
+        with patch("app.services.ai_service.AsyncOpenAI") as mock_openai_class:
+            mock_client = AsyncMock()
+            mock_client.chat.completions.create = AsyncMock(side_effect=create)
+            mock_openai_class.return_value = mock_client
+
+            response = await test_client.post(
+                "/api/chat/stream",
+                json={"message": "List my quizzes"},
+                headers=instructor_auth_headers,
+            )
+
+        events = parse_sse_events(response.text)
+        assert events[-1]["type"] == "done"
+        assert events[-1]["data"]["total"] == 1
+        assert len(stream_sessions) == 1
+        assert stream_sessions[0].closed
+
+    async def test_chat_stream_error_event(
+        self,
+        test_client: AsyncClient,
+        instructor_auth_headers: dict,
+    ):
+        """Test upstream errors end the stream with a generic error event."""
+        with patch("app.services.ai_service.AsyncOpenAI") as mock_openai_class:
+            mock_client = AsyncMock()
+            mock_client.chat.completions.create = AsyncMock(
+                side_effect=RuntimeError("Incorrect API key provided: sk-secret")
+            )
+            mock_openai_class.return_value = mock_client
+
+            response = await test_client.post(
+                "/api/chat/stream",
+                json={"message": "Hello"},
+                headers=instructor_auth_headers,
+            )
+
+        assert response.status_code == 200
+        assert "sk-secret" not in response.text
+        assert parse_sse_events(response.text) == [
+            {"type": "error", "detail": "AI service error"}
+        ]
+
+
 class TestChatInputSanitization:
     """Tests for input sanitization in chat."""
 
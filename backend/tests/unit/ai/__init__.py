@@ -0,0 +1 @@
+# AI unit tests package
@@ -0,0 +1,361 @@
+"""Unit tests for the AI chatbot ToolHandler."""
+
+import asyncio
+
+import orjson
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import app.ai.handlers as handlers
+from app.ai.handlers import ToolHandler
+from app.models.quiz import Quiz
+from app.models.user import User
+from app.services.analytics_service import AnalyticsService
+from app.services.quiz_service import QuizService
+
+pytestmark = pytest.mark.unit
+
+
+def make_questions(count: int, prefix: str = "Q") -> list:
+    """Build generated-question dicts as returned by the model."""
+    return [
+        {
+            "question_text": f"{prefix}{i}?",
+            "option_a": "A",
+            "option_b": "B",
+            "option_c": "C",
+            "option_d": "D",
+            "correct_answer": "A",
+            "explanation": "Because.",
+        }
+        for i in range(count)
+    ]
+
+
+def create_mock_openai_client(payload) -> MagicMock:
+    """Create an OpenAI client whose completions return payload as JSON."""
+    response = MagicMock()
+    response.choices = [MagicMock()]
+    response.choices[0].message.content = orjson.dumps(payload).decode()
+
+    client = MagicMock()
+    client.chat.completions.create = AsyncMock(return_value=response)
+    return client
+
+
+def create_handler(
+    db_session: AsyncSession, instructor: User, payload=None
+) -> ToolHandler:
+    """Create a ToolHandler with mocked Wikipedia and OpenAI clients."""
+    wikipedia = MagicMock()
+    wikipedia.search_and_extract = AsyncMock(return_value="Wikipedia text")
+    return ToolHandler(
+        QuizService(db_session),
+        AnalyticsService(db_session),
+        wikipedia,
+        create_mock_openai_client(payload),
+        instructor.id,
+    )
+
+
+def sent_prompt(handler: ToolHandler, call: int = -1) -> str:
+    """Return the user prompt of an OpenAI call made by the handler."""
+    calls = handler.client.chat.completions.create.call_args_list
+    return calls[call].kwargs["messages"][1]["content"]
+
+
+@pytest.fixture(autouse=True)
+def clear_question_pool():
+    handlers._question_pool.clear()
+    yield
+    handlers._question_pool.clear()
+
+
+class TestGenerateQuestions:
+    """Tests for ToolHandler._generate_questions."""
+
+    async def test_wikipedia_context_in_prompt(
+        self, db_session: AsyncSession, test_instructor: User
+    ):
+        """Test Wikipedia content is included in the generation prompt."""
+        handler = create_handler(
+            db_session, test_instructor, {"questions": make_questions(10)}
+        )
+
+        questions = await handler._generate_questions("Photosynthesis", 3)
+
+        assert len(questions) == 3
+        handler.wikipedia.search_and_extract.assert_awaited_once_with(
+            "Photosynthesis", max_chars=8000
+        )
+        assert "Wikipedia text" in sent_prompt(handler)
+
+    async def test_wikipedia_timeout_generates_without_context(
+        self, db_session: AsyncSession, test_instructor: User, monkeypatch
+    ):
+        """Test a slow Wikipedia lookup is abandoned after the timeout."""
+        monkeypatch.setattr(handlers, "WIKIPEDIA_TIMEOUT_SECONDS", 0.01)
+        handler = create_handler(
+            db_session, test_instructor, {"questions": make_questions(10)}
+        )
+
+        async def slow_extract(topic, max_chars):
+            await asyncio.sleep(1)
+            return "Late text"
+
+        handler.wikipedia.search_and_extract = slow_extract
+
+        questions = await handler._generate_questions("Photosynthesis", 3)
+
+        assert len(questions) == 3
+        assert "Wikipedia" not in sent_prompt(handler)
+
+
+class TestGenerateQuiz:
+    """Tests for the generate_quiz tool."""
+
+    async def test_invalid_answer_letter_raises_value_error(
+        self, db_session: AsyncSession, test_instructor: User
+    ):
+        """Test an unexpected correct_answer from the model raises ValueError."""
+        questions = make_questions(10)
+        questions[0]["correct_answer"] = "E"
+        handler = create_handler(db_session, test_instructor, {"questions": questions})
+
+        with pytest.raises(ValueError):
+            await handler.execute("generate_quiz", {"topic": "Mars"})
+
+
+class TestQuestionPool:
+    """Tests for the per-instructor question pool used by _generate_questions."""
+
+    async def test_surplus_is_stored(
+        self, db_session: AsyncSession, test_instructor: User
+    ):
+        """Test a full batch is generated and the unused questions are kept."""
+        handler = create_handler(
+            db_session, test_instructor, {"questions": make_questions(10)}
+        )
+
+        questions = await handler._generate_questions("Mars", 3)
+
+        assert [q["question_text"] for q in questions] == ["Q0?", "Q1?", "Q2?"]
+        assert "exactly 10 multiple-choice" in sent_prompt(handler)
+        _, pooled = handlers._question_pool[(test_instructor.id, "mars")]
+        assert [q["question_text"] for q in pooled] == [f"Q{i}?" for i in range(3, 10)]
+
+    async def test_follow_up_taken_from_pool(
+        self, db_session: AsyncSession, test_instructor: User
+    ):
+        """Test a repeat topic is served from the pool without another call."""
+        handler = create_handler(
+            db_session, test_instructor, {"questions": make_questions(10)}
+        )
+
+        await handler._generate_questions("Mars", 3)
+        questions = await handler._generate_questions(" mars ", 4)
+
+        assert [q["question_text"] for q in questions] == ["Q3?", "Q4?", "Q5?", "Q6?"]
+        handler.client.chat.completions.create.assert_awaited_once()
+
+    async def test_pool_is_per_instructor(
+        self, db_session: AsyncSession, test_instructor: User, test_student: User
+    ):
+        """Test another instructor's surplus is not reused."""
+        first = create_handler(
+            db_session, test_instructor, {"questions": make_questions(10)}
+        )
+        second = create_handler(
+            db_session, test_student, {"questions": make_questions(10, "Other")}
+        )
+
+        await first._generate_questions("Mars", 3)
+        questions = await second._generate_questions("Mars", 3)
+
+        assert [q["question_text"] for q in questions] == [
+            f"Other{i}?" for i in range(3)
+        ]
+        second.client.chat.completions.create.assert_awaited_once()
+
+    async def test_expired_pool_is_not_used(
+        self, db_session: AsyncSession, test_instructor: User, monkeypatch
+    ):
+        """Test pooled questions past their TTL trigger a fresh generation."""
+        monkeypatch.setattr(handlers, "QUESTION_POOL_TTL_SECONDS", 0.0)
+        handler = create_handler(
+            db_session, test_instructor, {"questions": make_questions(10)}
+        )
+
+        await handler._generate_questions("Mars", 3)
+        questions = await handler._generate_questions("Mars", 3)
+
+        assert [q["question_text"] for q in questions] == ["Q0?", "Q1?", "Q2?"]
+        assert handler.client.chat.completions.create.await_count == 2
+
+
+class TestAddQuestionsBulk:
+    """Tests for the add_questions_bulk tool."""
+
+    async def test_duplicate_quiz_requests_are_combined(
+        self, db_session: AsyncSession, sample_quiz: Quiz, test_instructor: User
+    ):
+        """Test two requests for one quiz get separate sets and one insert."""
+        handler = create_handler(
+            db_session,
+            test_instructor,
+            {"q0": make_questions(2, "First"), "q1": make_questions(3, "Second")},
+        )
+
+        result = await handler.execute(
+            "add_questions_bulk",
+            {
+                "requests": [
+                    {"quiz_title": "Sample", "num_questions": 2},
+                    {"quiz_title": "Sample Test Quiz", "num_questions": 3},
+                ]
+            },
+        )
+
+        assert result["success"] is True
+        assert result["results"] == [
+            {
+                "quiz_title": "Sample Test Quiz",
+                "success": True,
+                "questions_added": 5,
+                "total_questions": 10,
+            }
+        ]
+        assert sample_quiz.question_count == 10
+        prompt = sent_prompt(handler)
+        assert '"q0": exactly 2' in prompt
+        assert '"q1": exactly 3' in prompt
+
+    async def test_extra_generated_questions_are_trimmed(
+        self, db_session: AsyncSession, sample_quiz: Quiz, test_instructor: User
+    ):
+        """Test a set is cut to the requested size and unknown keys ignored."""
+        handler = create_handler(
+            db_session,
+            test_instructor,
+            {"q0": make_questions(4), "Sample Test Quiz": make_questions(4)},
+        )
+
+        result = await handler.execute(
+            "add_questions_bulk",
+            {"requests": [{"quiz_title": "Sample", "num_questions": 2}]},
+        )
+
+        assert result["results"][0]["questions_added"] == 2
+        assert result["results"][0]["total_questions"] == 7
+
+    async def test_not_found_quizzes_are_reported(
+        self, db_session: AsyncSession, sample_quiz: Quiz, test_instructor: User
+    ):
+        """Test missing quizzes are listed while found ones still get questions."""
+        handler = create_handler(db_session, test_instructor, {"q0": make_questions(1)})
+
+        result = await handler.execute(
+            "add_questions_bulk",
+            {
+                "requests": [
+                    {"quiz_title": "Chemistry"},
+                    {"quiz_title": "Sample"},
+                ]
+            },
+        )
+
+        assert result["success"] is True
+        assert result["not_found"] == ["Chemistry"]
+        assert result["results"][0]["questions_added"] == 1
+
+    async def test_no_quizzes_found(
+        self, db_session: AsyncSession, sample_quiz: Quiz, test_instructor: User
+    ):
+        """Test nothing is generated when none of the quizzes exist."""
+        handler = create_handler(db_session, test_instructor)
+
+        result = await handler.execute(
+            "add_questions_bulk", {"requests": [{"quiz_title": "Chemistry"}]}
+        )
+
+        assert result["success"] is False
+        assert result["not_found"] == ["Chemistry"]
+        assert result["available_quizzes"] == ["Sample Test Quiz"]
+        handler.client.chat.completions.create.assert_not_awaited()
+
+
+class TestExecuteMany:
+    """Tests for ToolHandler.execute_many."""
+
+    async def test_generate_quiz_calls_generate_concurrently(
+        self, db_session: AsyncSession, test_instructor: User
+    ):
+        """Test every generate_quiz call starts generating before any finishes."""
+        handler = create_handler(
+            db_session, test_instructor, {"questions": make_questions(10)}
+        )
+        response = handler.client.chat.completions.create.return_value
+        both_started = asyncio.Event()
+        started = 0
+
+        async def create(**kwargs):
+            nonlocal started
+            started += 1
+            if started == 2:
+                both_started.set()
+            # Blocks forever if the second generation waits for the first
+            await both_started.wait()
+            return response
+
+        handler.client.chat.completions.create = AsyncMock(side_effect=create)
+
+        results = await asyncio.wait_for(
+            handler.execute_many(
+                [
+                    ("generate_quiz", {"topic": "Mars", "num_questions": 2}),
+                    ("generate_quiz", {"topic": "Venus", "num_questions": 3}),
+                ]
+            ),
+            timeout=5,
+        )
+
+        assert [r["title"] for r in results] == ["Quiz: Mars", "Quiz: Venus"]
+        assert [r["question_count"] for r in results] == [2, 3]
+        assert handler.client.chat.completions.create.await_count == 2
+
+    async def test_failed_handler_cancels_pending_generation(
+        self, db_session: AsyncSession, test_instructor: User
+    ):
+        """Test generation still pending after an earlier failure is cancelled."""
+        handler = create_handler(db_session, test_instructor)
+        generation_started = asyncio.Event()
+        generation_cancelled = asyncio.Event()
+
+        async def create(**kwargs):
+            generation_started.set()
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                generation_cancelled.set()
+                raise
+
+        async def failing_list_quizzes(args):
+            await generation_started.wait()
+            raise RuntimeError("Database unavailable")
+
+        handler.client.chat.completions.create = AsyncMock(side_effect=create)
+        handler._handlers["list_quizzes"] = failing_list_quizzes
+
+        with pytest.raises(RuntimeError):
+            await asyncio.wait_for(
+                handler.execute_many(
+                    [
+                        ("list_quizzes", {}),
+                        ("generate_quiz", {"topic": "Mars", "num_questions": 2}),
+                    ]
+                ),
+                timeout=5,
+            )
+
+        await asyncio.wait_for(generation_cancelled.wait(), timeout=1)
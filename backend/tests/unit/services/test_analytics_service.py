@@ -5,8 +5,8 @@ from uuid import uuid4
 from datetime import datetime
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.services.analytics_service import AnalyticsService
-from app.models.user import User
+from app.services.analytics_service import AnalyticsService, _aggregates_cache
+from app.models.user import User, UserRole
 from app.models.quiz import Quiz
 from app.models.attempt import QuizAttempt, AttemptAnswer, AttemptStatus, AnswerOption
 
@@ -79,6 +79,34 @@ class TestAnalyticsServiceQuizAnalytics:
             assert "incorrect_count" in q
             assert "accuracy_rate" in q
 
+    async def test_quiz_analytics_exact_counts(
+        self,
+        db_session: AsyncSession,
+        sample_quiz: Quiz,
+        completed_attempt: QuizAttempt,
+    ):
+        """Test aggregated counts for a single attempt with 4 of 5 correct."""
+        service = AnalyticsService(db_session)
+
+        result = await service.get_quiz_analytics(sample_quiz.id)
+
+        assert result["total_attempts"] == 1
+        assert result["unique_students"] == 1
+        assert result["average_score"] == 4
+        assert result["score_distribution"] == {0: 0, 1: 0, 2: 0, 3: 0, 4: 1, 5: 0}
+
+        question_analysis = result["question_analysis"]
+        assert [q["order_index"] for q in question_analysis] == [0, 1, 2, 3, 4]
+        assert [q["correct_count"] for q in question_analysis] == [1, 1, 1, 1, 0]
+        assert [q["incorrect_count"] for q in question_analysis] == [0, 0, 0, 0, 1]
+        assert [q["accuracy_rate"] for q in question_analysis] == [
+            100,
+            100,
+            100,
+            100,
+            0,
+        ]
+
     async def test_quiz_analytics_student_scores(
         self,
         db_session: AsyncSession,
@@ -207,6 +235,82 @@ class TestAnalyticsServiceQuizAnalytics:
         )
         assert not instructor_in_scores
 
+    async def test_quiz_analytics_student_limit(
+        self,
+        db_session: AsyncSession,
+        sample_quiz: Quiz,
+        completed_attempt: QuizAttempt,
+        test_student: User,
+    ):
+        """Test student_limit keeps the top of the leaderboard only."""
+        other_student = User(
+            id=uuid4(),
+            email="other@test.com",
+            password_hash="x",
+            role=UserRole.STUDENT,
+            display_name="Other Student",
+            created_at=datetime.utcnow(),
+            updated_at=datetime.utcnow(),
+        )
+        db_session.add(other_student)
+        db_session.add(
+            QuizAttempt(
+                id=uuid4(),
+                quiz_id=sample_quiz.id,
+                user_id=other_student.id,
+                status=AttemptStatus.COMPLETED,
+                score=5,
+                started_at=datetime.utcnow(),
+                completed_at=datetime.utcnow(),
+            )
+        )
+        await db_session.commit()
+        service = AnalyticsService(db_session)
+
+        result = await service.get_quiz_analytics(sample_quiz.id, student_limit=1)
+
+        assert result["unique_students"] == 2
+        assert [s["user_id"] for s in result["student_scores"]] == [other_student.id]
+
+
+class TestAnalyticsServiceCache:
+    """Tests for the quiz attempt aggregates cache."""
+
+    async def test_quiz_analytics_cached_until_new_attempt(
+        self,
+        db_session: AsyncSession,
+        sample_quiz: Quiz,
+        completed_attempt: QuizAttempt,
+        test_student: User,
+    ):
+        """Test cached aggregates are reused and refreshed by a new attempt."""
+        service = AnalyticsService(db_session)
+
+        first = await service.get_quiz_analytics(sample_quiz.id)
+        cached_keys = [k for k in _aggregates_cache if k[0] == sample_quiz.id]
+        assert len(cached_keys) == 1
+
+        assert await service.get_quiz_analytics(sample_quiz.id) == first
+
+        db_session.add(
+            QuizAttempt(
+                id=uuid4(),
+                quiz_id=sample_quiz.id,
+                user_id=test_student.id,
+                status=AttemptStatus.COMPLETED,
+                score=2,
+                started_at=datetime.utcnow(),
+                completed_at=datetime.utcnow(),
+            )
+        )
+        await db_session.commit()
+
+        result = await service.get_quiz_analytics(sample_quiz.id)
+
+        assert result["total_attempts"] == 2
+        assert result["score_distribution"][2] == 1
+        assert result["student_scores"][0]["attempts_count"] == 2
+
 
 class TestAnalyticsServiceDashboardStats:
     """Tests for AnalyticsService.get_instructor_dashboard_stats method."""
@@ -260,6 +364,25 @@ class TestAnalyticsServiceDashboardStats:
         assert result["average_percentage"] >= 0
         assert result["average_percentage"] <= 100
 
+    async def test_dashboard_stats_exact_totals(
+        self,
+        db_session: AsyncSession,
+        sample_quiz: Quiz,
+        completed_attempt: QuizAttempt,
+        test_instructor: User,
+    ):
+        """Test dashboard totals for a single 4/5 student attempt."""
+        service = AnalyticsService(db_session)
+
+        result = await service.get_instructor_dashboard_stats(test_instructor.id)
+
+        assert result == {
+            "total_quizzes": 1,
+            "total_students": 1,
+            "total_attempts": 1,
+            "average_percentage": 80.0,
+        }
+
     async def test_dashboard_stats_excludes_instructor_attempts(
         self,
         db_session: AsyncSession,
@@ -32,6 +32,7 @@ class TestAttemptServiceStart:
         assert result.status == AttemptStatus.IN_PROGRESS
         assert result.score is None
         assert len(result.answers) == 5  # 5 question slots created
+        assert sample_quiz.attempt_count == 1
 
     async def test_start_attempt_resumes_existing(
         self, db_session: AsyncSession, sample_attempt: QuizAttempt, test_student: User
@@ -377,7 +378,8 @@ class TestAttemptServiceGetUserAttempts:
 
         assert result is not None
         assert result.total >= 1
-        assert any(a.id == completed_attempt.id for a in result.attempts)
+        summary = next(a for a in result.attempts if a.id == completed_attempt.id)
+        assert summary.total_questions == 5
 
     async def test_get_user_attempts_empty(
         self, db_session: AsyncSession, test_instructor: User
@@ -3,12 +3,15 @@
 import pytest
 from uuid import uuid4
 from typing import Dict, Any
+from sqlalchemy import func, select, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.services.quiz_service import QuizService
 from app.schemas.quiz import QuizCreate, QuizUpdate, QuestionCreate, SortOrder
 from app.models.user import User
-from app.models.quiz import Quiz, AnswerOption
+from app.models.quiz import Quiz, Question, AnswerOption
+from app.models.attempt import QuizAttempt, AttemptAnswer
 
 pytestmark = pytest.mark.unit
 
@@ -53,6 +56,7 @@ class TestQuizServiceCreate:
         assert result.instructor_id == test_instructor.id
         assert result.is_published is True
         assert len(result.questions) == 5
+        assert result.question_count == 5
         assert len(result.tags) == 2
 
     async def test_create_quiz_minimal_fields(
@@ -109,6 +113,142 @@ class TestQuizServiceGet:
 
         assert result is None
 
+    async def test_get_quiz_owner_id(
+        self, db_session: AsyncSession, sample_quiz: Quiz, test_instructor: User
+    ):
+        """Test getting a quiz's instructor id."""
+        service = QuizService(db_session)
+
+        result = await service.get_quiz_owner_id(sample_quiz.id)
+
+        assert result == test_instructor.id
+
+    async def test_get_quiz_owner_id_not_found(self, db_session: AsyncSession):
+        """Test getting the owner of a non-existent quiz returns None."""
+        service = QuizService(db_session)
+
+        result = await service.get_quiz_owner_id(uuid4())
+
+        assert result is None
+
+
+class TestQuizServiceFindByTitle:
+    """Tests for QuizService.find_with_titles method."""
+
+    async def test_find_exact_title_case_insensitive(
+        self, db_session: AsyncSession, sample_quiz: Quiz, test_instructor: User
+    ):
+        """Test finding a quiz by its exact title in a different case."""
+        service = QuizService(db_session)
+
+        quiz, titles = await service.find_with_titles(
+            test_instructor.id, "sample test quiz"
+        )
+
+        assert quiz is not None
+        assert quiz.id == sample_quiz.id
+        assert len(quiz.questions) == 5
+        assert titles == []
+
+    async def test_find_partial_title(
+        self, db_session: AsyncSession, sample_quiz: Quiz, test_instructor: User
+    ):
+        """Test finding a quiz by part of its title."""
+        service = QuizService(db_session)
+
+        quiz, _ = await service.find_with_titles(test_instructor.id, "Sample")
+
+        assert quiz is not None
+        assert quiz.id == sample_quiz.id
+
+    async def test_find_title_not_found(
+        self, db_session: AsyncSession, sample_quiz: Quiz, test_instructor: User
+    ):
+        """Test a missing title returns None with available titles."""
+        service = QuizService(db_session)
+
+        quiz, titles = await service.find_with_titles(test_instructor.id, "Chemistry")
+
+        assert quiz is None
+        assert titles == ["Sample Test Quiz"]
+
+    async def test_find_title_other_instructor(
+        self, db_session: AsyncSession, sample_quiz: Quiz, test_student: User
+    ):
+        """Test quizzes owned by another user are neither matched nor listed."""
+        service = QuizService(db_session)
+
+        quiz, titles = await service.find_with_titles(
+            test_student.id, "Sample Test Quiz"
+        )
+
+        assert quiz is None
+        assert titles == []
+
+    async def test_find_title_prefers_exact_match(
+        self, db_session: AsyncSession, sample_quiz: Quiz, test_instructor: User
+    ):
+        """Test an exact title match wins over a newer partial match."""
+        db_session.add(
+            Quiz(
+                title="Sample Test Quiz Extended",
+                topic="Extra",
+                instructor_id=test_instructor.id,
+            )
+        )
+        await db_session.commit()
+        service = QuizService(db_session)
+
+        quiz, _ = await service.find_with_titles(
+            test_instructor.id, "Sample Test Quiz"
+        )
+
+        assert quiz is not None
+        assert quiz.id == sample_quiz.id
+
+    async def test_find_with_titles_limit(
+        self, db_session: AsyncSession, sample_quiz: Quiz, test_instructor: User
+    ):
+        """Test the available titles list is capped on a miss."""
+        for i in range(3):
+            db_session.add(
+                Quiz(
+                    title=f"Extra Quiz {i}",
+                    topic="Extra",
+                    instructor_id=test_instructor.id,
+                )
+            )
+        await db_session.commit()
+        service = QuizService(db_session)
+
+        quiz, titles = await service.find_with_titles(
+            test_instructor.id, "Chemistry", limit=2
+        )
+
+        assert quiz is None
+        assert len(titles) == 2
+
+    async def test_find_with_titles_wildcard_titles_are_literal(
+        self, db_session: AsyncSession, test_instructor: User
+    ):
+        """Test % and _ in stored titles do not act as LIKE wildcards."""
+        for title in ["%", "50_50"]:
+            db_session.add(
+                Quiz(title=title, topic="Odd", instructor_id=test_instructor.id)
+            )
+        await db_session.commit()
+        service = QuizService(db_session)
+
+        quiz, _ = await service.find_with_titles(test_instructor.id, "Chemistry")
+        assert quiz is None
+
+        quiz, _ = await service.find_with_titles(test_instructor.id, "505x50 quiz")
+        assert quiz is None
+
+        quiz, _ = await service.find_with_titles(test_instructor.id, "my 50_50 quiz")
+        assert quiz is not None
+        assert quiz.title == "50_50"
+
 
 class TestQuizServiceList:
     """Tests for QuizService.list_quizzes method."""
@@ -193,6 +333,19 @@ class TestQuizServiceList:
         assert result.page_size == 5
         assert len(result.quizzes) <= 5
 
+    async def test_list_quizzes_total_past_last_page(
+        self, db_session: AsyncSession, sample_quiz: Quiz
+    ):
+        """Test that total is reported the same on a page with and without rows."""
+        service = QuizService(db_session)
+
+        first = await service.list_quizzes(page=1, page_size=1)
+        past_end = await service.list_quizzes(page=first.total + 1, page_size=1)
+
+        assert len(first.quizzes) == 1
+        assert past_end.quizzes == []
+        assert past_end.total == first.total
+
     async def test_list_quizzes_by_instructor(
         self, db_session: AsyncSession, sample_quiz: Quiz, test_instructor: User
     ):
@@ -204,6 +357,37 @@ class TestQuizServiceList:
         assert result.total >= 1
         assert all(q.instructor.id == test_instructor.id for q in result.quizzes)
 
+    async def test_list_quizzes_cursor_pagination(
+        self, db_session: AsyncSession, sample_quiz: Quiz, test_instructor: User
+    ):
+        """Test walking newest-first pages with next_cursor."""
+        for i in range(2):
+            db_session.add(
+                Quiz(
+                    title=f"Cursor Quiz {i}",
+                    topic="Paging",
+                    instructor_id=test_instructor.id,
+                )
+            )
+        await db_session.commit()
+        service = QuizService(db_session)
+
+        first = await service.list_quizzes(page_size=2)
+        second = await service.list_quizzes(page_size=2, cursor=first.next_cursor)
+
+        assert first.next_cursor is not None
+        assert len(second.quizzes) == 1
+        assert second.next_cursor is None
+        seen = {q.id for q in first.quizzes + second.quizzes}
+        assert len(seen) == 3
+
+    async def test_list_quizzes_invalid_cursor(self, db_session: AsyncSession):
+        """Test a malformed cursor is rejected."""
+        service = QuizService(db_session)
+
+        with pytest.raises(ValueError):
+            await service.list_quizzes(cursor="not-a-cursor")
+
 
 class TestQuizServiceInstructorQuizzes:
     """Tests for QuizService.get_instructor_quizzes method."""
@@ -218,6 +402,8 @@ class TestQuizServiceInstructorQuizzes:
 
         assert result.total >= 1
         assert all(q.instructor.id == test_instructor.id for q in result.quizzes)
+        listed = next(q for q in result.quizzes if q.id == sample_quiz.id)
+        assert listed.question_count == 5
 
     async def test_get_instructor_quizzes_empty(
         self, db_session: AsyncSession, test_student: User
@@ -318,6 +504,36 @@ class TestQuizServiceUpdate:
 
         assert result is None
 
+    async def test_replace_answered_questions_is_rejected(
+        self,
+        db_session: AsyncSession,
+        completed_attempt: QuizAttempt,
+        test_instructor: User,
+    ):
+        """Test replacing questions students have answered keeps their answers."""
+        service = QuizService(db_session)
+        update_data = QuizUpdate(
+            questions=[
+                QuestionCreate(
+                    question_text="Replacement?",
+                    option_a="A",
+                    option_b="B",
+                    option_c="C",
+                    option_d="D",
+                    correct_answer=AnswerOption.A,
+                )
+            ]
+        )
+
+        with pytest.raises(IntegrityError):
+            await service.update_quiz(
+                completed_attempt.quiz_id, update_data, test_instructor.id
+            )
+        await db_session.rollback()
+
+        count = await db_session.scalar(select(func.count()).select_from(AttemptAnswer))
+        assert count == 5
+
 
 class TestQuizServiceDelete:
     """Tests for QuizService.delete_quiz method."""
@@ -336,6 +552,23 @@ class TestQuizServiceDelete:
         deleted = await service.get_quiz_by_id(quiz_id)
         assert deleted is None
 
+    async def test_delete_quiz_cascades(
+        self,
+        db_session: AsyncSession,
+        sample_attempt: QuizAttempt,
+        test_instructor: User,
+    ):
+        """Test deleting a quiz removes its questions, attempts and answers."""
+        service = QuizService(db_session)
+        quiz_id = sample_attempt.quiz_id
+
+        result = await service.delete_quiz(quiz_id, test_instructor.id)
+
+        assert result is True
+        for model in (Question, QuizAttempt, AttemptAnswer):
+            count = await db_session.scalar(select(func.count()).select_from(model))
+            assert count == 0
+
     async def test_delete_quiz_wrong_instructor(
         self, db_session: AsyncSession, sample_quiz: Quiz, test_student: User
     ):
@@ -459,6 +692,41 @@ class TestQuizServiceAddQuestions:
         assert len(result) == 2
         assert result[0].question_text == "New question 1?"
         assert result[1].question_text == "New question 2?"
+        # Numbering continues after the sample quiz's five questions
+        assert [q.order_index for q in result] == [5, 6]
+        assert sample_quiz.question_count == 7
+
+    async def test_add_questions_increments_stored_count(
+        self, db_session: AsyncSession, sample_quiz: Quiz, test_instructor: User
+    ):
+        """Test question_count is incremented in SQL, keeping concurrent adds."""
+        # Another writer's increment that this session has not loaded
+        await db_session.execute(
+            update(Quiz)
+            .where(Quiz.id == sample_quiz.id)
+            .values(question_count=Quiz.question_count + 3)
+            .execution_options(synchronize_session=False)
+        )
+        service = QuizService(db_session)
+        new_question = {
+            "question_text": "Concurrent?",
+            "option_a": "A",
+            "option_b": "B",
+            "option_c": "C",
+            "option_d": "D",
+            "correct_answer": "A",
+        }
+
+        result = await service.add_questions(
+            sample_quiz.id, test_instructor.id, [new_question]
+        )
+
+        assert result is not None
+        assert sample_quiz.question_count == 9
+        stored = await db_session.scalar(
+            select(Quiz.question_count).where(Quiz.id == sample_quiz.id)
+        )
+        assert stored == 9
 
     async def test_add_questions_wrong_instructor(
         self, db_session: AsyncSession, sample_quiz: Quiz, test_student: User
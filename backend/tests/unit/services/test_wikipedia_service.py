@@ -0,0 +1,64 @@
+"""Unit tests for WikipediaService."""
+
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from app.services.wikipedia_service import WikipediaService, _extract_cache
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture(autouse=True)
+def clear_extract_cache():
+    _extract_cache.clear()
+    yield
+    _extract_cache.clear()
+
+
+class TestWikipediaServiceCache:
+    """Tests for the extract cache in WikipediaService.search_and_extract."""
+
+    async def test_repeat_topic_served_from_cache(self):
+        """Test that a repeated, differently-cased topic skips the network."""
+        service = WikipediaService()
+
+        with patch.object(
+            WikipediaService, "_fetch_extract", AsyncMock(return_value="Text")
+        ) as fetch:
+            first = await service.search_and_extract("Photosynthesis")
+            second = await WikipediaService().search_and_extract(" photosynthesis ")
+
+        assert first == second == "Text"
+        fetch.assert_awaited_once()
+
+    async def test_concurrent_misses_share_one_fetch(self):
+        """Test that simultaneous lookups for one topic fetch only once."""
+        service = WikipediaService()
+
+        async def slow_fetch(self, topic, max_chars):
+            await asyncio.sleep(0.01)
+            return "Text"
+
+        with patch.object(
+            WikipediaService, "_fetch_extract", autospec=True, side_effect=slow_fetch
+        ) as fetch:
+            results = await asyncio.gather(
+                *(service.search_and_extract("Photosynthesis") for _ in range(3))
+            )
+
+        assert results == ["Text", "Text", "Text"]
+        assert fetch.call_count == 1
+
+    async def test_unavailable_result_not_cached(self):
+        """Test that a None result is retried on the next call."""
+        service = WikipediaService()
+
+        with patch.object(
+            WikipediaService, "_fetch_extract", AsyncMock(side_effect=[None, "Text"])
+        ) as fetch:
+            assert await service.search_and_extract("Photosynthesis") is None
+            assert await service.search_and_extract("Photosynthesis") == "Text"
+
+        assert fetch.await_count == 2